@@ -9,189 +9,262 @@ Main handlers module for CodeLogic MCP server.
 This module provides the main handler registry and routing for all CodeLogic tools.
 """
 
-import sys
+import logging
+import jsonschema
+from jsonschema.validators import validator_for
 import mcp.types as types
 from ..server import server
-from .method_impact import handle_method_impact
+from .method_impact import MAX_BATCH_ITEMS, handle_method_impact, handle_method_impact_batch
 from .database_impact import handle_database_impact
 from .ci import handle_ci
 from .graph_tools import GRAPH_TOOL_DISPATCH, handle_graph_tool
+from .common import log_and_raise
 
+logger = logging.getLogger(__name__)
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """
-    List available tools.
-    Each tool specifies its arguments using JSON Schema validation.
-    """
-    return [
-        types.Tool(
-            name="codelogic-method-impact",
-            description="Analyze impacts of modifying a specific method within a given class or type.\n"
-                        "Uses CODELOGIC_WORKSPACE_NAME environment variable to determine the target workspace.\n"
-                        "Recommended workflow:\n"
-                        "1. Use this tool before implementing code changes\n"
-                        "2. Run the tool against methods or functions that are being modified\n"
-                        "3. Carefully review the impact analysis results to understand potential downstream effects\n"
-                        "Particularly crucial when AI-suggested modifications are being considered.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "method": {"type": "string", "description": "Name of the method being analyzed"},
-                    "class": {"type": "string", "description": "Name of the class containing the method"},
-                },
-                "required": ["method", "class"],
+
+# Tool definitions are static, so build them once at import time
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="codelogic-method-impact",
+        description="Analyze impacts of modifying a specific method within a given class or type.\n"
+                    "Uses CODELOGIC_WORKSPACE_NAME environment variable to determine the target workspace.\n"
+                    "Recommended workflow:\n"
+                    "1. Use this tool before implementing code changes\n"
+                    "2. Run the tool against methods or functions that are being modified\n"
+                    "3. Carefully review the impact analysis results to understand potential downstream effects\n"
+                    "Particularly crucial when AI-suggested modifications are being considered.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "method": {"type": "string", "description": "Name of the method being analyzed"},
+                "class": {"type": "string", "description": "Name of the class containing the method"},
             },
-        ),
-        types.Tool(
-            name="codelogic-database-impact",
-            description="Analyze impacts between code and database entities.\n"
-                        "Uses CODELOGIC_WORKSPACE_NAME environment variable to determine the target workspace.\n"
-                        "Recommended workflow:\n"
-                        "1. Use this tool before implementing code or database changes\n"
-                        "2. Search for the relevant database entity\n"
-                        "3. Review the impact analysis to understand which code depends on this database object and vice versa\n"
-                        "Particularly crucial when AI-suggested modifications are being considered or when modifying SQL code.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Type of database entity to search for (column, table, or view)",
-                        "enum": ["column", "table", "view"]
+            "required": ["method", "class"],
+        },
+    ),
+    types.Tool(
+        name="codelogic-method-impact-batch",
+        description="Analyze impacts of modifying several methods in one call.\n"
+                    "Runs the codelogic-method-impact analysis for each method/class pair concurrently and returns the reports in order.\n"
+                    "Uses CODELOGIC_WORKSPACE_NAME environment variable to determine the target workspace.\n"
+                    "Prefer this over repeated codelogic-method-impact calls when a change touches multiple methods.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "description": f"Methods to analyze (at most {MAX_BATCH_ITEMS})",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "method": {"type": "string", "description": "Name of the method being analyzed"},
+                            "class": {"type": "string", "description": "Name of the class containing the method"},
+                        },
+                        "required": ["method", "class"],
                     },
-                    "name": {"type": "string", "description": "Name of the database entity to search for"},
-                    "table_or_view": {"type": "string", "description": "Name of the table or view containing the column (required for columns only)"},
+                    "minItems": 1,
+                    "maxItems": MAX_BATCH_ITEMS,
                 },
-                "required": ["entity_type", "name"],
             },
-        ),
-        types.Tool(
-            name="codelogic-ci",
-            description="Unified CodeLogic CI integration: generate scan (analyze) and build-info steps for CI/CD.\n"
-                        "Provides AI-actionable file modifications, templates, and best practices for Jenkins, GitHub Actions, Azure DevOps, and GitLab.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "agent_type": {
-                        "type": "string",
-                        "description": "Type of CodeLogic agent to configure",
-                        "enum": ["dotnet", "java", "sql", "javascript"]
-                    },
-                    "scan_path": {"type": "string", "description": "Directory path to be scanned (e.g., /path/to/your/code)"},
-                    "application_name": {"type": "string", "description": "Name of the application being scanned"},
-                    "ci_platform": {
-                        "type": "string",
-                        "description": "CI/CD platform for which to generate configuration",
-                        "enum": ["jenkins", "github-actions", "azure-devops", "gitlab", "generic"]
-                    }
+            "required": ["items"],
+        },
+    ),
+    types.Tool(
+        name="codelogic-database-impact",
+        description="Analyze impacts between code and database entities.\n"
+                    "Uses CODELOGIC_WORKSPACE_NAME environment variable to determine the target workspace.\n"
+                    "Recommended workflow:\n"
+                    "1. Use this tool before implementing code or database changes\n"
+                    "2. Search for the relevant database entity\n"
+                    "3. Review the impact analysis to understand which code depends on this database object and vice versa\n"
+                    "Particularly crucial when AI-suggested modifications are being considered or when modifying SQL code.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": {
+                    "type": "string",
+                    "description": "Type of database entity to search for (column, table, or view)",
+                    "enum": ["column", "table", "view"]
                 },
-                "required": ["agent_type", "scan_path", "application_name"],
+                "name": {"type": "string", "description": "Name of the database entity to search for"},
+                "table_or_view": {"type": "string", "description": "Name of the table or view containing the column (required for columns only)"},
             },
-        ),
-        types.Tool(
-            name="codelogic-graph-capabilities",
-            description="Fetch graph API capabilities/manifest from the CodeLogic server (GET). "
-                        "Returns label and relationship metadata when the graph tier is deployed; "
-                        "otherwise explains missing routes. Uses CODELOGIC_WORKSPACE_NAME for MV id unless "
-                        "`materialized_view_id` is set.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "materialized_view_id": {
-                        "type": "string",
-                        "description": "Optional materialized view id; default from workspace name",
-                    },
+            "required": ["entity_type", "name"],
+        },
+    ),
+    types.Tool(
+        name="codelogic-ci",
+        description="Unified CodeLogic CI integration: generate scan (analyze) and build-info steps for CI/CD.\n"
+                    "Provides AI-actionable file modifications, templates, and best practices for Jenkins, GitHub Actions, Azure DevOps, and GitLab.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "agent_type": {
+                    "type": "string",
+                    "description": "Type of CodeLogic agent to configure",
+                    "enum": ["dotnet", "java", "sql", "javascript"]
                 },
-                "additionalProperties": False,
-            },
-        ),
-        types.Tool(
-            name="codelogic-graph-search",
-            description="Search the CodeLogic knowledge graph (curated HTTP API). "
-                        "Provide `query` or `identity_prefix`; optional `scan_space`, `materialized_view_id`, `limit`. "
-                        "Requires server route POST .../ai-retrieval/graph/search.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Symbol or text query (alias: q)"},
-                    "q": {"type": "string", "description": "Alias for query"},
-                    "identity_prefix": {"type": "string", "description": "Prefix of stable graph identity"},
-                    "scan_space": {"type": "string", "description": "Optional scan-space / branch filter"},
-                    "materialized_view_id": {"type": "string", "description": "Override MV id; default from workspace name"},
-                    "prefer_latest_scan": {"type": "boolean"},
-                    "limit": {"type": "integer", "description": "Suggested max hits (server may cap)"},
+                "additional_agent_types": {
+                    "type": "array",
+                    "description": "Extra agent types to scan alongside agent_type. GitHub Actions runs them as a matrix and Jenkins as parallel stages",
+                    "items": {"type": "string", "enum": ["dotnet", "java", "sql", "javascript"]}
                 },
-            },
-        ),
-        types.Tool(
-            name="codelogic-graph-impact",
-            description="Bounded graph impact from seed node ids (curated HTTP API). "
-                        "Optional `direction` (upstream|downstream|both), `depth`, `scan_space`, `materialized_view_id`.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "seed_node_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Graph node ids to expand from",
-                    },
-                    "direction": {"type": "string", "enum": ["upstream", "downstream", "both"]},
-                    "depth": {"type": "integer"},
-                    "scan_space": {"type": "string"},
-                    "materialized_view_id": {"type": "string"},
+                "scan_path": {"type": "string", "description": "Directory path to be scanned (e.g., /path/to/your/code)"},
+                "application_name": {"type": "string", "description": "Name of the application being scanned"},
+                "ci_platform": {
+                    "type": "string",
+                    "description": "CI/CD platform for which to generate configuration",
+                    "enum": ["jenkins", "github-actions", "azure-devops", "gitlab", "generic"]
                 },
-                "required": ["seed_node_ids"],
-            },
-        ),
-        types.Tool(
-            name="codelogic-graph-path-explain",
-            description="Explain bounded paths between two graph nodes (curated HTTP API). "
-                        "Requires `from_node_id`, `to_node_id`; optional `max_depth`, `scan_space`, `materialized_view_id`.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "from_node_id": {"type": "string"},
-                    "to_node_id": {"type": "string"},
-                    "max_depth": {"type": "integer"},
-                    "scan_space": {"type": "string"},
-                    "materialized_view_id": {"type": "string"},
+                "runner_size": {
+                    "type": "string",
+                    "description": "GitHub Actions runner for the scan job: small (ubuntu-latest), large (ubuntu-latest-4-cores), or self-hosted. Defaults to small",
+                    "enum": ["small", "large", "self-hosted"]
                 },
-                "required": ["from_node_id", "to_node_id"],
+                "image_digest": {
+                    "type": "string",
+                    "description": "Optional sha256 digest of the agent image. When set, generated pipelines reference the image by digest instead of :latest and skip --pull always"
+                }
             },
-        ),
-        types.Tool(
-            name="codelogic-graph-validate-change-scope",
-            description="Validate whether a proposed change scope is safe given seed graph nodes (curated HTTP API).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "seed_node_ids": {"type": "array", "items": {"type": "string"}},
-                    "proposed_change_summary": {"type": "string"},
-                    "scan_space": {"type": "string"},
-                    "materialized_view_id": {"type": "string"},
+            "required": ["agent_type", "scan_path", "application_name"],
+        },
+    ),
+    types.Tool(
+        name="codelogic-graph-capabilities",
+        description="Fetch graph API capabilities/manifest from the CodeLogic server (GET). "
+                    "Returns label and relationship metadata when the graph tier is deployed; "
+                    "otherwise explains missing routes. Uses CODELOGIC_WORKSPACE_NAME for MV id unless "
+                    "`materialized_view_id` is set.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "materialized_view_id": {
+                    "type": "string",
+                    "description": "Optional materialized view id; default from workspace name",
                 },
-                "required": ["seed_node_ids", "proposed_change_summary"],
             },
-        ),
-        types.Tool(
-            name="codelogic-graph-owners",
-            description="Look up owners/reviewers for a graph node (curated HTTP API). "
-                        "Provide `node_id` or `identity_prefix`.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_id": {"type": "string"},
-                    "identity_prefix": {"type": "string"},
-                    "scan_space": {"type": "string"},
-                    "materialized_view_id": {"type": "string"},
+            "additionalProperties": False,
+        },
+    ),
+    types.Tool(
+        name="codelogic-graph-search",
+        description="Search the CodeLogic knowledge graph (curated HTTP API). "
+                    "Provide `query` or `identity_prefix`; optional `scan_space`, `materialized_view_id`, `limit`. "
+                    "Requires server route POST .../ai-retrieval/graph/search.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Symbol or text query (alias: q)"},
+                "q": {"type": "string", "description": "Alias for query"},
+                "identity_prefix": {"type": "string", "description": "Prefix of stable graph identity"},
+                "scan_space": {"type": "string", "description": "Optional scan-space / branch filter"},
+                "materialized_view_id": {"type": "string", "description": "Override MV id; default from workspace name"},
+                "prefer_latest_scan": {"type": "boolean"},
+                "limit": {"type": "integer", "description": "Suggested max hits (server may cap)"},
+            },
+        },
+    ),
+    types.Tool(
+        name="codelogic-graph-impact",
+        description="Bounded graph impact from seed node ids (curated HTTP API). "
+                    "Optional `direction` (upstream|downstream|both), `depth`, `scan_space`, `materialized_view_id`.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "seed_node_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Graph node ids to expand from",
                 },
+                "direction": {"type": "string", "enum": ["upstream", "downstream", "both"]},
+                "depth": {"type": "integer"},
+                "scan_space": {"type": "string"},
+                "materialized_view_id": {"type": "string"},
+            },
+            "required": ["seed_node_ids"],
+        },
+    ),
+    types.Tool(
+        name="codelogic-graph-path-explain",
+        description="Explain bounded paths between two graph nodes (curated HTTP API). "
+                    "Requires `from_node_id`, `to_node_id`; optional `max_depth`, `scan_space`, `materialized_view_id`.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "from_node_id": {"type": "string"},
+                "to_node_id": {"type": "string"},
+                "max_depth": {"type": "integer"},
+                "scan_space": {"type": "string"},
+                "materialized_view_id": {"type": "string"},
             },
-        ),
-    ]
+            "required": ["from_node_id", "to_node_id"],
+        },
+    ),
+    types.Tool(
+        name="codelogic-graph-validate-change-scope",
+        description="Validate whether a proposed change scope is safe given seed graph nodes (curated HTTP API).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "seed_node_ids": {"type": "array", "items": {"type": "string"}},
+                "proposed_change_summary": {"type": "string"},
+                "scan_space": {"type": "string"},
+                "materialized_view_id": {"type": "string"},
+            },
+            "required": ["seed_node_ids", "proposed_change_summary"],
+        },
+    ),
+    types.Tool(
+        name="codelogic-graph-owners",
+        description="Look up owners/reviewers for a graph node (curated HTTP API). "
+                    "Provide `node_id` or `identity_prefix`.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_id": {"type": "string"},
+                "identity_prefix": {"type": "string"},
+                "scan_space": {"type": "string"},
+                "materialized_view_id": {"type": "string"},
+            },
+        },
+    ),
+]
+
+# Input validators compiled once per tool. The MCP framework's own validation
+# calls jsonschema.validate, which re-checks the schema on every request, so it
+# is disabled on the call_tool registration below in favor of these.
+_VALIDATORS = {tool.name: validator_for(tool.inputSchema)(tool.inputSchema) for tool in _TOOLS}
+
+# Report returned when a tool raises; placeholders are {name} and {error}
+TOOL_ERROR_TEMPLATE = """# Error executing tool: {name}
+
+An error occurred while executing this tool:
+```
+{error}
+```
+Please check the server logs for more details.
+"""
+
+# Async tool handlers keyed by tool name; graph tools route through GRAPH_TOOL_DISPATCH
+_DISPATCH = {
+    "codelogic-method-impact": handle_method_impact,
+    "codelogic-method-impact-batch": handle_method_impact_batch,
+    "codelogic-database-impact": handle_database_impact,
+    "codelogic-ci": handle_ci,
+}
 
 
-@server.call_tool()
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """
+    List available tools.
+    Each tool specifies its arguments using JSON Schema validation.
+    """
+    return _TOOLS
+
+
+@server.call_tool(validate_input=False)
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
@@ -199,31 +272,26 @@ async def handle_call_tool(
     Handle tool execution requests.
     Tools can modify server state and notify clients of changes.
     """
+    # Validation errors propagate so the framework reports them as tool errors,
+    # exactly as its built-in validation did
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(arguments or {}))
+        if error is not None:
+            raise ValueError(f"Input validation error: {error.message}")
+
     try:
-        if name == "codelogic-method-impact":
-            return await handle_method_impact(arguments)
-        elif name == "codelogic-database-impact":
-            return await handle_database_impact(arguments)
-        elif name == "codelogic-ci":
-            return await handle_ci(arguments)
-        elif name in GRAPH_TOOL_DISPATCH:
+        handler = _DISPATCH.get(name)
+        if handler is not None:
+            return await handler(arguments)
+        if name in GRAPH_TOOL_DISPATCH:
             return handle_graph_tool(name, arguments)
-        else:
-            sys.stderr.write(f"Unknown tool: {name}\n")
-            raise ValueError(f"Unknown tool: {name}")
+        log_and_raise(f"Unknown tool: {name}")
     except Exception as e:
-        sys.stderr.write(f"Error handling tool call {name}: {str(e)}\n")
-        error_message = f"""# Error executing tool: {name}
-
-An error occurred while executing this tool:
-```
-{str(e)}
-```
-Please check the server logs for more details.
-"""
+        logger.error("Error handling tool call %s: %s", name, e)
         return [
             types.TextContent(
                 type="text",
-                text=error_message
+                text=TOOL_ERROR_TEMPLATE.format(name=name, error=e)
             )
         ]
@@ -7,14 +7,71 @@
 Handler for the codelogic-ci tool.
 """
 
+import json
 import os
-import sys
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
 import mcp.types as types
 
-from .common import SEND_BUILD_INFO_IMAGE, SEND_BUILD_INFO_GITHUB_ACTION
+from .common import SEND_BUILD_INFO_IMAGE, SEND_BUILD_INFO_GITHUB_ACTION, log_and_raise
+
+# Accepted handle_ci arguments, with the joined lists used in validation errors
+VALID_AGENT_TYPES = frozenset({"dotnet", "java", "sql", "javascript"})
+VALID_AGENT_TYPES_STR = "dotnet, java, sql, javascript"
+VALID_CI_PLATFORMS = frozenset({"jenkins", "github-actions", "azure-devops", "gitlab", "generic"})
+VALID_CI_PLATFORMS_STR = "jenkins, github-actions, azure-devops, gitlab, generic"
+# Agent image name for each agent type
+AGENT_IMAGES = {
+    "dotnet": "codelogic_dotnet",
+    "java": "codelogic_java",
+    "sql": "codelogic_sql",
+    "javascript": "codelogic_javascript",
+}
+# Platforms whose generators can fan a scan out across several agent types
+MULTI_AGENT_CI_PLATFORMS = frozenset({"jenkins", "github-actions"})
+# GitHub Actions runs-on values for the CodeLogic scan job, by runner size
+GITHUB_RUNNERS = {
+    "small": "ubuntu-latest",
+    "large": "ubuntu-latest-4-cores",
+    "self-hosted": "[self-hosted, codelogic]",
+}
+VALID_RUNNER_SIZES_STR = "small, large, self-hosted"
+# Changes that never affect scan results; generated GitHub workflows skip them
+DEFAULT_PATHS_IGNORE = ("**.md", "docs/**", ".github/ISSUE_TEMPLATE/**", "LICENSE")
+IMAGE_DIGEST_PATTERN = re.compile(r"(?:sha256:)?([0-9a-f]{64})")
+
+# Static section of the CI integration guide; a plain string, so the CI
+# expressions below need no brace escaping
+ENVIRONMENT_VARIABLE_GUIDE = """## 🔧 Environment Variable Usage Guide
+
+### For CodeLogic Test Error Reporting Operations:
+- **Required**: `CODELOGIC_HOST`, `AGENT_UUID`, `AGENT_PASSWORD`
+- **Purpose**: Send test error reporting metadata and context to CodeLogic
+
+### Send Test Error Reporting Command Syntax:
+- **Use explicit parameters**: `--agent-uuid`, `--agent-password`, `--server`
+- **Include pipeline system**: `--pipeline-system="Jenkins"`, `"GitHub Actions"`, `"Azure DevOps"`, `"GitLab CI/CD"`
+
+#### **GitHub Actions:**
+- `--job-name="${{ github.repository }}"`
+- `--build-number="${{ github.run_number }}"`
+- `--build-status="${{ job.status }}"`
+- `--pipeline-system="GitHub Actions"`
+
+#### **Azure DevOps:**
+- `--job-name="${{ BUILD_DEFINITIONNAME }}"`
+- `--build-number="${{ BUILD_BUILDNUMBER }}"`
+- `--build-status="${{ AGENT_JOBSTATUS }}"`
+- `--pipeline-system="Azure DevOps"`
+
+#### **GitLab CI/CD:**
+- `--job-name="${{ CI_PROJECT_NAME }}"`
+- `--build-number="${{ CI_PIPELINE_ID }}"`
+- `--build-status="${{ CI_JOB_STATUS }}"`
+- `--pipeline-system="GitLab CI/CD"`
+"""
 
 
 def analyze_build_logs(successful_log: Optional[str], failed_log: Optional[str]) -> Dict:
@@ -152,8 +209,8 @@ def generate_log_filter_script(filtering_config: Dict, platform: str) -> str:
     min_line_length = filtering_config.get("min_line_length", 3)
     max_repetition = filtering_config.get("max_repetition", 3)
     
-    # Generate bash/shell filtering script
-    filter_script = f"""# Log filtering script to reduce verbosity
+    # Generate bash/shell filtering script, collecting chunks and joining once at the end
+    parts = [f"""# Log filtering script to reduce verbosity
 # This script filters out low-value log content identified from your build log examples
 
 filter_log() {{
@@ -178,47 +235,47 @@ filter_log() {{
         fi
         
         # Filter known noise patterns
-"""
+"""]
     
     # Add pattern filtering
     for pattern in patterns[:15]:  # Limit to top 15 patterns
         escaped_pattern = pattern.replace("'", "'\\''").replace('\\', '\\\\')
-        filter_script += f"""        if echo "$line" | grep -qE '{escaped_pattern}'; then
+        parts.append(f"""        if echo "$line" | grep -qE '{escaped_pattern}'; then
             skip_line=true
         fi
-"""
+""")
     
     # Add exact line filtering (repetitive lines)
     for exact_line in exact_lines[:50]:  # Limit to top 50 exact lines
         escaped_line = exact_line.replace("'", "'\\''").replace('"', '\\"').replace('$', '\\$').replace('`', '\\`')
-        filter_script += f"""        if [ "$line" = "{escaped_line}" ]; then
+        parts.append(f"""        if [ "$line" = "{escaped_line}" ]; then
             skip_line=true
         fi
-"""
+""")
     
     # Add short line filtering
     for short_line in short_lines[:50]:  # Limit to top 50 short lines
         escaped_short = short_line.replace("'", "'\\''").replace('"', '\\"').replace('$', '\\$').replace('`', '\\`')
-        filter_script += f"""        if [ "$line" = "{escaped_short}" ]; then
+        parts.append(f"""        if [ "$line" = "{escaped_short}" ]; then
             skip_line=true
         fi
-"""
+""")
     
     # Add verbose prefix filtering
     if verbose_prefixes:
-        filter_script += """        # Filter lines starting with verbose prefixes (if prefix appears too frequently)
-"""
+        parts.append("""        # Filter lines starting with verbose prefixes (if prefix appears too frequently)
+""")
         for prefix in verbose_prefixes[:20]:  # Limit to top 20 prefixes
             escaped_prefix = prefix.replace("'", "'\\''").replace('\\', '\\\\').replace('$', '\\$')
-            filter_script += f"""        if echo "$line" | grep -qE '^{escaped_prefix}'; then
+            parts.append(f"""        if echo "$line" | grep -qE '^{escaped_prefix}'; then
             prefix_count=$(grep -c "^${{escaped_prefix}}" "$input_file" 2>/dev/null || echo "0")
             if [ "$prefix_count" -gt {max_repetition} ]; then
                 skip_line=true
             fi
         fi
-"""
+""")
     
-    filter_script += """        # Output line if not filtered
+    parts.append("""        # Output line if not filtered
         if [ "$skip_line" = false ]; then
             echo "$line"
         fi
@@ -229,51 +286,15 @@ filter_log() {{
     
     rm -f "$temp_file"
 }
-"""
-    
-    return filter_script
-
-
-def generate_log_filtering_instructions(filtering_config: Optional[Dict], platform: str, agent_type: str = "dotnet") -> str:
-    """
-    Generate instructions for integrating log filtering into CI/CD pipelines.
-    """
-    if not filtering_config:
-        return ""
+""")
     
-    summary = filtering_config.get("summary", {})
-    filter_script = generate_log_filter_script(filtering_config, platform)
-    
-    instructions = f"""
-## 📊 Log Filtering Configuration
-
-Based on analysis of your build logs, the following filtering has been configured to reduce verbosity:
+    return "".join(parts)
 
-### Analysis Summary
-- **Total lines analyzed**: {summary.get('total_lines_analyzed', 0)}
-- **Repetitive lines found**: {summary.get('repetitive_lines_found', 0)} (lines that repeat frequently)
-- **Short noise lines found**: {summary.get('short_noise_lines_found', 0)} (very short lines that appear often)
-- **Verbose prefixes identified**: {summary.get('verbose_prefixes_found', 0)} (common prefixes indicating verbose output)
 
-### Filtering Strategy
-
-The log filtering will:
-1. **Remove identified noise patterns**: Based on analysis of your provided log examples, the following low-value content will be filtered:
-   - Repetitive lines (exact lines that appear many times)
-   - Very short lines (identified from your logs)
-   - Verbose prefixes (common prefixes that indicate repetitive verbose output)
-   - Empty lines and separator lines
-2. **Keep everything else**: All other log content is preserved - we only filter out the specific noise patterns identified from your examples
-3. **Reduce verbosity**: Focus on removing known noise patterns from your specific build output without trying to predict what's valuable
-
-### Integration Instructions
-
-**IMPORTANT**: Apply log filtering BEFORE sending logs to CodeLogic. This ensures only valuable information is sent.
-
-"""
-    
-    if platform == "jenkins":
-        instructions += f"""
+def _jenkins_log_filtering_steps(filter_script: str, image_digest: Optional[str] = None) -> str:
+    """Log filtering and send-build-info steps for Jenkins"""
+    pull = _pull_option(image_digest, " \\\n" + " " * 20)
+    return f"""
 #### For Jenkins:
 
 Add this filtering step in your post block before sending build info:
@@ -299,13 +320,12 @@ post {{
             // Use filtered log for CodeLogic
             sh '''
                 docker run \\
-                    --pull always \\
-                    --rm \\
+                    {pull}--rm \\
                     --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
                     --env AGENT_UUID="${{AGENT_UUID}}" \\
                     --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
                     --volume "${{WORKSPACE}}:/scan" \\
-                    --volume "${{WORKSPACE}}/logs:/log_file_path" \\
+                    --volume "${{WORKSPACE}}/logs:/log_file_path:ro" \\
                     {SEND_BUILD_INFO_IMAGE} send_build_info \\
                     --agent-uuid="${{AGENT_UUID}}" \\
                     --agent-password="${{AGENT_PASSWORD}}" \\
@@ -324,8 +344,11 @@ post {{
 }}
 ```
 """
-    elif platform == "github-actions":
-        instructions += f"""
+
+
+def _github_actions_log_filtering_steps(filter_script: str, image_digest: Optional[str] = None) -> str:
+    """Log filtering and send-build-info steps for GitHub Actions"""
+    return f"""
 #### For GitHub Actions:
 
 Add this filtering step before sending build info:
@@ -358,8 +381,12 @@ Add this filtering step before sending build info:
 
 > **Note**: Prefer the GitHub Action above. It runs `{SEND_BUILD_INFO_IMAGE}`. Write logs under the workspace (e.g. `logs/`) so they are available at `/github/workspace/...`.
 """
-    elif platform == "azure-devops":
-        instructions += f"""
+
+
+def _azure_devops_log_filtering_steps(filter_script: str, image_digest: Optional[str] = None) -> str:
+    """Log filtering and send-build-info steps for Azure DevOps"""
+    pull = _pull_option(image_digest, " \\\n" + " " * 6)
+    return f"""
 #### For Azure DevOps:
 
 Add this filtering step before sending build info:
@@ -382,13 +409,12 @@ Add this filtering step before sending build info:
   inputs:
     command: 'run'
     arguments: |
-      --pull always \\
-      --rm \\
+      {pull}--rm \\
       --env CODELOGIC_HOST="$(codelogicHost)" \\
       --env AGENT_UUID="$(agentUuid)" \\
       --env AGENT_PASSWORD="$(agentPassword)" \\
       --volume "$(Build.SourcesDirectory):/scan" \\
-      --volume "$(Build.SourcesDirectory)/logs:/log_file_path" \\
+      --volume "$(Build.SourcesDirectory)/logs:/log_file_path:ro" \\
       {SEND_BUILD_INFO_IMAGE} send_build_info \\
       --agent-uuid="$(agentUuid)" \\
       --agent-password="$(agentPassword)" \\
@@ -404,8 +430,12 @@ Add this filtering step before sending build info:
   continueOnError: true
 ```
 """
-    elif platform == "gitlab":
-        instructions += f"""
+
+
+def _gitlab_log_filtering_steps(filter_script: str, image_digest: Optional[str] = None) -> str:
+    """Log filtering and send-build-info steps for GitLab CI/CD"""
+    pull = _pull_option(image_digest, " \\\n" + " " * 8)
+    return f"""
 #### For GitLab CI/CD:
 
 Add this filtering step before sending build info:
@@ -427,19 +457,18 @@ filter_logs:
 
 send_build_info:
   stage: build-info
-  image: docker:latest
+  image: docker:24-cli
   services:
-    - docker:dind
+    - docker:24-dind
   script:
     - |
       docker run \\
-        --pull always \\
-        --rm \\
+        {pull}--rm \\
         --env CODELOGIC_HOST="$CODELOGIC_HOST" \\
         --env AGENT_UUID="$AGENT_UUID" \\
         --env AGENT_PASSWORD="$AGENT_PASSWORD" \\
         --volume "$CI_PROJECT_DIR:/scan" \\
-        --volume "$CI_PROJECT_DIR/logs:/log_file_path" \\
+        --volume "$CI_PROJECT_DIR/logs:/log_file_path:ro" \\
         {SEND_BUILD_INFO_IMAGE} send_build_info \\
         --agent-uuid="$AGENT_UUID" \\
         --agent-password="$AGENT_PASSWORD" \\
@@ -457,8 +486,60 @@ send_build_info:
   allow_failure: true
 ```
 """
+
+
+# Platform-specific log filtering steps used by generate_log_filtering_instructions
+_LOG_FILTERING_STEPS = {
+    "jenkins": _jenkins_log_filtering_steps,
+    "github-actions": _github_actions_log_filtering_steps,
+    "azure-devops": _azure_devops_log_filtering_steps,
+    "gitlab": _gitlab_log_filtering_steps,
+}
+
+
+def generate_log_filtering_instructions(filtering_config: Optional[Dict], platform: str, agent_type: str = "dotnet", image_digest: Optional[str] = None) -> str:
+    """
+    Generate instructions for integrating log filtering into CI/CD pipelines.
+    """
+    if not filtering_config:
+        return ""
+    
+    summary = filtering_config.get("summary", {})
+    filter_script = generate_log_filter_script(filtering_config, platform)
+    
+    parts = [f"""
+## 📊 Log Filtering Configuration
+
+Based on analysis of your build logs, the following filtering has been configured to reduce verbosity:
+
+### Analysis Summary
+- **Total lines analyzed**: {summary.get('total_lines_analyzed', 0)}
+- **Repetitive lines found**: {summary.get('repetitive_lines_found', 0)} (lines that repeat frequently)
+- **Short noise lines found**: {summary.get('short_noise_lines_found', 0)} (very short lines that appear often)
+- **Verbose prefixes identified**: {summary.get('verbose_prefixes_found', 0)} (common prefixes indicating verbose output)
+
+### Filtering Strategy
+
+The log filtering will:
+1. **Remove identified noise patterns**: Based on analysis of your provided log examples, the following low-value content will be filtered:
+   - Repetitive lines (exact lines that appear many times)
+   - Very short lines (identified from your logs)
+   - Verbose prefixes (common prefixes that indicate repetitive verbose output)
+   - Empty lines and separator lines
+2. **Keep everything else**: All other log content is preserved - we only filter out the specific noise patterns identified from your examples
+3. **Reduce verbosity**: Focus on removing known noise patterns from your specific build output without trying to predict what's valuable
+
+### Integration Instructions
+
+**IMPORTANT**: Apply log filtering BEFORE sending logs to CodeLogic. This ensures only valuable information is sent.
+
+"""]
     
-    instructions += """
+    platform_steps = _LOG_FILTERING_STEPS.get(platform)
+    if platform_steps:
+        parts.append(platform_steps(filter_script, image_digest))
+    
+    parts.append("""
 ### Customization
 
 You can further customize the filtering by:
@@ -473,40 +554,52 @@ After implementing log filtering:
 2. Check that verbose noise patterns identified from your examples have been reduced
 3. Verify that important information (errors, failures, etc.) is still present
 4. Adjust filtering rules in the script if needed - add more patterns or remove overly aggressive filters
-"""
+""")
     
-    return instructions
+    return "".join(parts)
 
 
 async def handle_ci(arguments: dict | None) -> list[types.TextContent]:
     """Handle the codelogic-ci tool for unified CI/CD configuration (analyze + build-info)"""
     if not arguments:
-        sys.stderr.write("Missing arguments\n")
-        raise ValueError("Missing arguments")
+        log_and_raise("Missing arguments")
 
     agent_type = arguments.get("agent_type")
     scan_path = arguments.get("scan_path")
     application_name = arguments.get("application_name")
     ci_platform = arguments.get("ci_platform", "generic")
+    additional_agent_types = arguments.get("additional_agent_types") or []
+    runner_size = arguments.get("runner_size", "small")
+    image_digest = arguments.get("image_digest")
     successful_build_log = arguments.get("successful_build_log")
     failed_build_log = arguments.get("failed_build_log")
 
     # Validate required parameters
     if not agent_type or not scan_path or not application_name:
-        sys.stderr.write("Agent type, scan path, and application name are required\n")
-        raise ValueError("Agent type, scan path, and application name are required")
-
-    # Validate agent type
-    valid_agent_types = ["dotnet", "java", "sql", "javascript"]
-    if agent_type not in valid_agent_types:
-        sys.stderr.write(f"Invalid agent type: {agent_type}. Must be one of: {', '.join(valid_agent_types)}\n")
-        raise ValueError(f"Invalid agent type: {agent_type}. Must be one of: {', '.join(valid_agent_types)}")
-
-    # Validate CI platform
-    valid_ci_platforms = ["jenkins", "github-actions", "azure-devops", "gitlab", "generic"]
-    if ci_platform not in valid_ci_platforms:
-        sys.stderr.write(f"Invalid CI platform: {ci_platform}. Must be one of: {', '.join(valid_ci_platforms)}\n")
-        raise ValueError(f"Invalid CI platform: {ci_platform}. Must be one of: {', '.join(valid_ci_platforms)}")
+        log_and_raise("Agent type, scan path, and application name are required")
+
+    # Validate enumerated parameters
+    for label, value, allowed, allowed_str in (
+        ("agent type", agent_type, VALID_AGENT_TYPES, VALID_AGENT_TYPES_STR),
+        ("CI platform", ci_platform, VALID_CI_PLATFORMS, VALID_CI_PLATFORMS_STR),
+        ("runner size", runner_size, GITHUB_RUNNERS, VALID_RUNNER_SIZES_STR),
+    ):
+        if value not in allowed:
+            log_and_raise(f"Invalid {label}: {value}. Must be one of: {allowed_str}")
+    for extra_agent_type in additional_agent_types:
+        if extra_agent_type not in VALID_AGENT_TYPES:
+            log_and_raise(f"Invalid agent type: {extra_agent_type}. Must be one of: {VALID_AGENT_TYPES_STR}")
+
+    # Primary agent first, duplicates dropped; a tuple keeps the generators cacheable
+    agent_types = tuple(dict.fromkeys([agent_type, *additional_agent_types]))
+
+    if image_digest:
+        digest_match = IMAGE_DIGEST_PATTERN.fullmatch(image_digest)
+        if not digest_match:
+            log_and_raise(f"Invalid image digest: {image_digest}. Must be a sha256 digest (64 hex characters)")
+        if len(agent_types) > 1:
+            log_and_raise("An image digest pins a single agent image and cannot be combined with additional agent types")
+        image_digest = digest_match.group(1)
 
     # Get server configuration
     server_host = os.getenv("CODELOGIC_SERVER_HOST")
@@ -519,7 +612,7 @@ async def handle_ci(arguments: dict | None) -> list[types.TextContent]:
     # Generate Docker agent configuration based on agent type
     agent_config = generate_docker_agent_config(
         agent_type, scan_path, application_name, 
-        ci_platform, server_host, log_filtering_config
+        ci_platform, server_host, log_filtering_config, agent_types, runner_size, image_digest
     )
 
     return [
@@ -530,18 +623,32 @@ async def handle_ci(arguments: dict | None) -> list[types.TextContent]:
     ]
 
 
-def generate_docker_agent_config(agent_type, scan_path, application_name, ci_platform, server_host, log_filtering_config: Optional[Dict] = None):
+def generate_docker_agent_config(agent_type, scan_path, application_name, ci_platform, server_host, log_filtering_config: Optional[Dict] = None, agent_types: Optional[Tuple[str, ...]] = None, runner_size: str = "small", image_digest: Optional[str] = None):
     """Generate Docker agent configuration with AI-actionable prompts for CI/CD file modification"""
-    
-    # Agent type mappings
-    agent_images = {
-        "dotnet": "codelogic_dotnet",
-        "java": "codelogic_java", 
-        "sql": "codelogic_sql",
-        "javascript": "codelogic_javascript"
-    }
-    
-    agent_image = agent_images.get(agent_type, "codelogic_dotnet")
+    agent_types = agent_types or (agent_type,)
+    if log_filtering_config:
+        return _render_docker_agent_config(
+            agent_type, scan_path, application_name, ci_platform, server_host,
+            log_filtering_config, agent_types, runner_size, image_digest
+        )
+    return _docker_agent_config_without_log_filtering(
+        agent_type, scan_path, application_name, ci_platform, server_host,
+        agent_types, runner_size, image_digest
+    )
+
+
+@lru_cache(maxsize=128)
+def _docker_agent_config_without_log_filtering(agent_type, scan_path, application_name, ci_platform, server_host, agent_types, runner_size, image_digest):
+    """Memoized guide for requests without build logs, where every input is hashable"""
+    return _render_docker_agent_config(
+        agent_type, scan_path, application_name, ci_platform, server_host,
+        None, agent_types, runner_size, image_digest
+    )
+
+
+def _render_docker_agent_config(agent_type, scan_path, application_name, ci_platform, server_host, log_filtering_config, agent_types, runner_size, image_digest):
+    """Render the full CI integration guide; see generate_docker_agent_config"""
+    agent_image = AGENT_IMAGES.get(agent_type, "codelogic_dotnet")
     
     # Generate structured data for AI models to directly modify CI/CD files
     structured_config = {
@@ -551,8 +658,8 @@ def generate_docker_agent_config(agent_type, scan_path, application_name, ci_pla
             "AGENT_UUID": "your-agent-uuid",
             "AGENT_PASSWORD": "your-agent-password"
         },
-        "docker_command": generate_docker_command(agent_type, scan_path, application_name, server_host, agent_image),
-        "file_modifications": generate_file_modifications(ci_platform, agent_type, scan_path, application_name, server_host, agent_image),
+        "docker_command": generate_docker_command(agent_type, scan_path, application_name, server_host, agent_image, image_digest),
+        "file_modifications": generate_file_modifications(ci_platform, agent_type, scan_path, application_name, server_host, agent_image, image_digest, agent_types, runner_size),
         "setup_instructions": generate_setup_instructions(ci_platform),
         "validation_checks": generate_validation_checks(ci_platform)
     }
@@ -566,7 +673,8 @@ def generate_docker_agent_config(agent_type, scan_path, application_name, ci_pla
 
 """
     
-    config = f"""# CodeLogic CI Integration - Unified CI/CD Guide
+    # Collect the report sections and join them once at the end
+    parts = [f"""# CodeLogic CI Integration - Unified CI/CD Guide
 {log_filtering_note}## 🎯 AI Model Instructions
 
 **Use the structured data below to directly modify CI/CD files in the repository.**
@@ -591,49 +699,24 @@ def generate_docker_agent_config(agent_type, scan_path, application_name, ci_pla
 ### Validation Checks
 {format_validation_checks(structured_config['validation_checks'])}
 
-## 🔧 Environment Variable Usage Guide
-
-### For CodeLogic Test Error Reporting Operations:
-- **Required**: `CODELOGIC_HOST`, `AGENT_UUID`, `AGENT_PASSWORD`
-- **Purpose**: Send test error reporting metadata and context to CodeLogic
-
-### Send Test Error Reporting Command Syntax:
-- **Use explicit parameters**: `--agent-uuid`, `--agent-password`, `--server`
-- **Include pipeline system**: `--pipeline-system="Jenkins"`, `"GitHub Actions"`, `"Azure DevOps"`, `"GitLab CI/CD"`
-
-#### **GitHub Actions:**
-- `--job-name="${{{{ github.repository }}}}"`
-- `--build-number="${{{{ github.run_number }}}}"`
-- `--build-status="${{{{ job.status }}}}"`
-- `--pipeline-system="GitHub Actions"`
-
-#### **Azure DevOps:**
-- `--job-name="${{{{ BUILD_DEFINITIONNAME }}}}"`
-- `--build-number="${{{{ BUILD_BUILDNUMBER }}}}"`
-- `--build-status="${{{{ AGENT_JOBSTATUS }}}}"`
-- `--pipeline-system="Azure DevOps"`
-
-#### **GitLab CI/CD:**
-- `--job-name="${{{{ CI_PROJECT_NAME }}}}"`
-- `--build-number="${{{{ CI_PIPELINE_ID }}}}"`
-- `--build-status="${{{{ CI_JOB_STATUS }}}}"`
-- `--pipeline-system="GitLab CI/CD"`
-"""
+"""]
+    parts.append(ENVIRONMENT_VARIABLE_GUIDE)
 
     # Add platform-specific configurations
-    if ci_platform == "jenkins":
-        config += generate_jenkins_config(agent_type, scan_path, application_name, server_host)
-    elif ci_platform == "github-actions":
-        config += generate_github_actions_config(agent_type, scan_path, application_name, server_host)
-    elif ci_platform == "azure-devops":
-        config += generate_azure_devops_config(agent_type, scan_path, application_name, server_host)
-    elif ci_platform == "gitlab":
-        config += generate_gitlab_config(agent_type, scan_path, application_name, server_host)
-    else:
-        config += generate_generic_config(agent_type, scan_path, application_name, server_host)
+    platform_config = _PLATFORM_CONFIG_GENERATORS.get(ci_platform, generate_generic_config)
+    platform_kwargs = {"image_digest": image_digest}
+    if ci_platform in MULTI_AGENT_CI_PLATFORMS:
+        platform_kwargs["agent_types"] = agent_types
+    if ci_platform == "github-actions":
+        platform_kwargs["runner_size"] = runner_size
+    parts.append(platform_config(agent_type, scan_path, application_name, server_host, **platform_kwargs))
+    if ci_platform not in MULTI_AGENT_CI_PLATFORMS and len(agent_types) > 1:
+        parts.append(f"""
+> **Additional agent types**: repeat the CodeLogic scan job above for {', '.join(f'`{t}`' for t in agent_types[1:])}, changing the `codelogic_<agent>` image name. Jobs without dependencies on each other run in parallel.
+""")
 
     # Add build info section
-    config += f"""
+    parts.append(f"""
 
 ## Build Information Integration
 
@@ -646,26 +729,27 @@ docker run --rm \\
     --env AGENT_UUID="${{AGENT_UUID}}" \\
     --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
     --volume "{scan_path}:/scan" \\
-    --volume "${{PWD}}/logs:/log_file_path" \\
+    --volume "${{PWD}}/logs:/log_file_path:ro" \\
     {SEND_BUILD_INFO_IMAGE} send_build_info \\
-    --log-file="/log_file_path/build.log"
+    --log-file="/log_file_path/build.log" \\
+    --log-lines=1000
 ```
-"""
+""")
 
     # Add log filtering instructions if log analysis was performed
     if log_filtering_config:
-        config += generate_log_filtering_instructions(log_filtering_config, ci_platform, agent_type)
+        parts.append(generate_log_filtering_instructions(log_filtering_config, ci_platform, agent_type, image_digest))
     
-    config += """
+    parts.append("""
 ## Best Practices
 
 3. **Security**: Store credentials as environment variables, never in code
-4. **Performance**: Use `--pull always` to ensure latest agent version
+4. **Performance**: Reuse the agent image cached by the Docker daemon (or the CI cache) instead of pulling on every scan; refresh it on a schedule or pin `image_digest`
 5. **Logging**: Mount log directories for error reporting collection
-"""
+""")
 
     # Append unified pipeline and best-practices guidance
-    config += """
+    parts.append("""
 
 ## Pipeline Overview
 
@@ -722,25 +806,85 @@ SCAN_SPACE_PREFIX="your-team" # optional
 2. Incremental scans with --rescan
 3. Set Docker memory limits appropriately
 4. Use Docker layer caching
-"""
+""")
+
+    return "".join(parts)
+
+
+# How generated scripts reference the CodeLogic connection settings, by CI syntax
+_SHELL_CREDENTIALS = ("$CODELOGIC_HOST", "$AGENT_UUID", "$AGENT_PASSWORD")
+_BRACED_SHELL_CREDENTIALS = ("${CODELOGIC_HOST}", "${AGENT_UUID}", "${AGENT_PASSWORD}")
+_GITHUB_SECRET_CREDENTIALS = ("${{ secrets.CODELOGIC_HOST }}", "${{ secrets.AGENT_UUID }}", "${{ secrets.AGENT_PASSWORD }}")
+_AZURE_VARIABLE_CREDENTIALS = ("$(codelogicHost)", "$(agentUuid)", "$(agentPassword)")
 
-    return config
+
+def _agent_image(repository, image_digest=None):
+    """Reference an agent image repository by sha256 digest when pinned, else by its latest tag"""
+    return f"{repository}@sha256:{image_digest}" if image_digest else f"{repository}:latest"
+
+
+def _pull_option(image_digest=None, separator=" "):
+    """The --pull always option for generated docker run commands
+
+    A digest-pinned image never changes, so once it is present locally the
+    docker daemon can use it without a registry round-trip; pinned pipelines
+    drop the option. separator follows the option, e.g. a line continuation.
+    """
+    return "" if image_digest else f"--pull always{separator}"
+
+
+@lru_cache(maxsize=128)
+def _analyze_command(docker_run, credentials, volume, image, application_name, path, scan_space_name='"YOUR_SCAN_SPACE_NAME"', indent="    "):
+    """Render the docker run ... analyze invocation shared by every generated pipeline
+
+    The first line is unindented so it can sit inline in a template; continuation
+    lines are prefixed with indent. Scratch files go to a RAM-backed /tmp rather
+    than the container's overlay filesystem. No --cpus/--memory limits are set:
+    analysis of large codebases needs whatever the runner has, and a memory
+    limit would also have to cover the tmpfs.
+    """
+    host, uuid, password = credentials
+    return f" \\\n{indent}".join((
+        docker_run,
+        "--tmpfs /tmp:rw,size=2g,exec",
+        "--security-opt no-new-privileges",
+        f'--env CODELOGIC_HOST="{host}"',
+        f'--env AGENT_UUID="{uuid}"',
+        f'--env AGENT_PASSWORD="{password}"',
+        f'--volume "{volume}"',
+        f"{image} analyze",
+        f'--application "{application_name}"',
+        f"--path {path}",
+        f"--scan-space-name {scan_space_name}",
+        "--rescan",
+        "--expunge-scan-sessions",
+    ))
+
+
+# CI/CD files to modify for each platform
+_TARGET_FILES: dict[str, tuple[str, ...]] = {
+    "jenkins": ("Jenkinsfile", ".jenkins/pipeline.groovy"),
+    "github-actions": (".github/workflows/*.yml",),
+    "azure-devops": ("azure-pipelines.yml", ".azure-pipelines/*.yml"),
+    "gitlab": (".gitlab-ci.yml",),
+    "generic": ("*.yml", "*.yaml", "Jenkinsfile", "Dockerfile")
+}
 
 
 def get_target_files(ci_platform):
     """Get target files for each CI/CD platform"""
-    platform_files = {
-        "jenkins": ["Jenkinsfile", ".jenkins/pipeline.groovy"],
-        "github-actions": [".github/workflows/*.yml"],
-        "azure-devops": ["azure-pipelines.yml", ".azure-pipelines/*.yml"],
-        "gitlab": [".gitlab-ci.yml"],
-        "generic": ["*.yml", "*.yaml", "Jenkinsfile", "Dockerfile"]
-    }
-    return platform_files.get(ci_platform, platform_files["generic"])
+    return _TARGET_FILES.get(ci_platform, _TARGET_FILES["generic"])
 
 
-def generate_docker_command(agent_type, scan_path, application_name, server_host, agent_image):
+@lru_cache(maxsize=128)
+def generate_docker_command(agent_type, scan_path, application_name, server_host, agent_image, image_digest=None):
     """Generate the Docker command template with proper environment variable handling"""
+    scan_command = _analyze_command(
+        f"docker run {_pull_option(image_digest)}--rm --interactive", _BRACED_SHELL_CREDENTIALS,
+        f"{scan_path}:/scan", _agent_image(f"{server_host}/{agent_image}", image_digest),
+        application_name, "/scan", indent=" " * 4,
+    )
+    pull = _pull_option(image_digest, " \\\n" + " " * 4)
     return f"""# CodeLogic Scan Operation - Docker Command
 
 ## Required Environment Variables (Scan Operation)
@@ -750,17 +894,7 @@ def generate_docker_command(agent_type, scan_path, application_name, server_host
 
 ## Docker Command
 ```bash
-docker run --pull always --rm --interactive \\
-    --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
-    --env AGENT_UUID="${{AGENT_UUID}}" \\
-    --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
-    --volume "{scan_path}:/scan" \\
-    {server_host}/{agent_image}:latest analyze \\
-    --application "{application_name}" \\
-    --path /scan \\
-    --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-    --rescan \\
-    --expunge-scan-sessions
+{scan_command}
 ```
 
 ## ⚠️ CRITICAL: Scan Target Must Be Built Artifacts, NOT Source Code
@@ -796,13 +930,12 @@ For GitHub Actions, prefer `{SEND_BUILD_INFO_GITHUB_ACTION}` instead of `docker
 ```bash
 # Standardized send_build_info command (Jenkins / Azure / GitLab / generic)
 docker run \\
-    --pull always \\
-    --rm \\
+    {pull}--rm \\
     --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
     --env AGENT_UUID="${{AGENT_UUID}}" \\
     --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
     --volume "${{WORKSPACE}}:/scan" \\
-    --volume "${{WORKSPACE}}/logs:/log_file_path" \\
+    --volume "${{WORKSPACE}}/logs:/log_file_path:ro" \\
     {SEND_BUILD_INFO_IMAGE} send_build_info \\
     --agent-uuid="${{AGENT_UUID}}" \\
     --agent-password="${{AGENT_PASSWORD}}" \\
@@ -831,26 +964,31 @@ docker run \\
 - `--verbose`: Extra logging"""
 
 
-def generate_file_modifications(ci_platform, agent_type, scan_path, application_name, server_host, agent_image):
-    """Generate specific file modifications for each platform"""
+def _jenkins_file_modifications(agent_type, scan_path, application_name, server_host, agent_image, image_digest=None):
+    """Jenkinsfile environment block, scan stage and build-info post step"""
     _dq3 = '"""'  # triple double-quote for embedding in f-string (avoids closing the f-string in Jenkins sh blocks)
-    modifications = {
-        "jenkins": {
-            "file": "Jenkinsfile",
-            "modifications": [
-                {
-                    "type": "add_environment",
-                    "location": "environment block",
-                    "content": f"""environment {{
+    jenkins_scan_command = _analyze_command(
+        "docker run --rm --interactive", _BRACED_SHELL_CREDENTIALS,
+        "${WORKSPACE}:/workspace", _agent_image(f"${{CODELOGIC_HOST}}/codelogic_{agent_type}", image_digest),
+        application_name, '"/workspace/$ARTIFACT_PATH"', indent=" " * 20,
+    )
+    pull = _pull_option(image_digest, " \\\n" + " " * 28)
+    return {
+        "file": "Jenkinsfile",
+        "modifications": [
+            {
+                "type": "add_environment",
+                "location": "environment block",
+                "content": f"""environment {{
     CODELOGIC_HOST = '{server_host}'
     AGENT_UUID = credentials('codelogic-agent-uuid')
     AGENT_PASSWORD = credentials('codelogic-agent-password')
 }}"""
-                },
-                {
-                    "type": "add_stage",
-                    "location": "after build stages",
-                    "content": f"""stage('CodeLogic Scan') {{
+            },
+            {
+                "type": "add_stage",
+                "location": "after build stages",
+                "content": f"""stage('CodeLogic Scan') {{
     when {{
         anyOf {{
             branch 'main'
@@ -879,17 +1017,7 @@ def generate_file_modifications(ci_platform, agent_type, scan_path, application_
                 # Use artifact path (built artifacts, not source code)
                 ARTIFACT_PATH="{scan_path}"  # Replace with your actual artifact directory
                 
-                docker run --pull always --rm --interactive \\
-                    --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
-                    --env AGENT_UUID="${{AGENT_UUID}}" \\
-                    --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
-                    --volume "${{WORKSPACE}}:/workspace" \\
-                    ${{CODELOGIC_HOST}}/codelogic_{agent_type}:latest analyze \\
-                    --application "{application_name}" \\
-                    --path "/workspace/$ARTIFACT_PATH" \\
-                    --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-                    --rescan \\
-                    --expunge-scan-sessions
+                {jenkins_scan_command}
             '''
         }}
     }}
@@ -1010,13 +1138,12 @@ post {{
                     
                     sh '''
                         docker run \\
-                            --pull always \\
-                            --rm \\
+                            {pull}--rm \\
                             --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
                             --env AGENT_UUID="${{AGENT_UUID}}" \\
                             --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
                             --volume "${{WORKSPACE}}:/scan" \\
-                            --volume "${{WORKSPACE}}/logs:/log_file_path" \\
+                            --volume "${{WORKSPACE}}/logs:/log_file_path:ro" \\
                             {SEND_BUILD_INFO_IMAGE} send_build_info \\
                             --agent-uuid="${{AGENT_UUID}}" \\
                             --agent-password="${{AGENT_PASSWORD}}" \\
@@ -1045,58 +1172,125 @@ post {{
 // 
 // SECURITY NOTE: This approach does NOT pull console logs from Jenkins (which is a security risk).
 // Instead, each stage logs its output to files using tee/Tee-Object, and those files are consolidated here."""
-                }
-            ]
-        },
-        "github-actions": {
-            "file": ".github/workflows/codelogic-scan.yml",
-            "modifications": [
-                {
-                    "type": "create_file",
-                    "content": f"""name: CodeLogic Scan
+            }
+        ]
+    }
+
+
+def _github_image_cache_steps(cache_label, image, image_digest=None):
+    """GitHub Actions steps that restore the agent image from actions/cache or pull and save it"""
+    if image_digest:
+        key_steps = f"""    - name: Cache CodeLogic agent image
+      id: codelogic-image-cache
+      uses: actions/cache@v4
+      with:
+        path: /tmp/codelogic-image.tar
+        # The digest pins the image, so the cached tarball never goes stale
+        key: codelogic-{cache_label}-{image_digest[:12]}"""
+    else:
+        key_steps = f"""    - name: Compute CodeLogic image cache week
+      id: codelogic-image-week
+      run: echo "week=$(date +%G-%V)" >> "$GITHUB_OUTPUT"
+
+    - name: Cache CodeLogic agent image
+      id: codelogic-image-cache
+      uses: actions/cache@v4
+      with:
+        path: /tmp/codelogic-image.tar
+        # The weekly bucket picks up new :latest agent releases; changing the workflow refreshes it at once
+        key: codelogic-{cache_label}-${{{{ steps.codelogic-image-week.outputs.week }}}}-${{{{ hashFiles('.github/workflows/*.yml') }}}}"""
+    return f"""{key_steps}
+
+    - name: Pull CodeLogic agent image
+      if: steps.codelogic-image-cache.outputs.cache-hit != 'true'
+      run: |
+        docker pull {image}
+        docker save {image} -o /tmp/codelogic-image.tar
+
+    - name: Load cached CodeLogic agent image
+      if: steps.codelogic-image-cache.outputs.cache-hit == 'true'
+      run: docker load -i /tmp/codelogic-image.tar"""
+
+
+@lru_cache(maxsize=128)
+def _github_scan_workflow(agent_type, scan_path, application_name, agent_types, fetch_depth, runner_size, paths_ignore, image_digest):
+    """Render .github/workflows/codelogic-scan.yml; shared by the guide and the structured file modifications"""
+    paths_ignore_yaml = "[ " + ", ".join(f"'{path}'" for path in paths_ignore) + " ]"
+    scan_runner = GITHUB_RUNNERS.get(runner_size, GITHUB_RUNNERS["small"])
+    agent_types_json = json.dumps(list(agent_types))
+    # A digest pins exactly one agent image, so the matrix entry cannot vary it
+    if image_digest:
+        matrix_image = _agent_image(f"${{{{ secrets.CODELOGIC_HOST }}}}/codelogic_{agent_type}", image_digest)
+    else:
+        matrix_image = _agent_image("${{ secrets.CODELOGIC_HOST }}/codelogic_${{ matrix.agent-type }}")
+    image_cache_steps = _github_image_cache_steps("${{ matrix.agent-type }}", matrix_image, image_digest)
+    matrix_scan_command = _analyze_command(
+        "docker run --rm", _GITHUB_SECRET_CREDENTIALS,
+        "${{ github.workspace }}:/workspace", matrix_image,
+        application_name, '"/workspace/$ARTIFACT_PATH"', indent=" " * 10,
+    )
+    return f"""name: CodeLogic Scan
 
 on:
   push:
     branches: [ main, develop, feature/* ]
+    paths-ignore: {paths_ignore_yaml}
   pull_request:
     branches: [ main ]
+    paths-ignore: {paths_ignore_yaml}
+
+# Cancel superseded pull request runs; pushes to main/develop always finish
+concurrency:
+  group: codelogic-${{{{ github.workflow }}}}-${{{{ github.ref }}}}
+  cancel-in-progress: ${{{{ github.event_name == 'pull_request' }}}}
 
 jobs:
   codelogic-scan:
-    runs-on: ubuntu-latest
+    # Static analysis is CPU-bound; size this runner to the codebase
+    runs-on: {scan_runner}
+    strategy:
+      # One runner per agent type; a failing agent does not cancel the others
+      fail-fast: false
+      matrix:
+        agent-type: {agent_types_json}
     
     steps:
     - name: Checkout code
       uses: actions/checkout@v4
       with:
-        fetch-depth: 0
+        # The scan reads built artifacts only, so a shallow clone is enough
+        fetch-depth: {fetch_depth}
       
+{image_cache_steps}
+
     - name: CodeLogic Scan
       run: |
-        docker run --pull always --rm \\
-          --env CODELOGIC_HOST="${{{{ secrets.CODELOGIC_HOST }}}}" \\
-          --env AGENT_UUID="${{{{ secrets.AGENT_UUID }}}}" \\
-          --env AGENT_PASSWORD="${{{{ secrets.AGENT_PASSWORD }}}}" \\
-          --volume "${{{{ github.workspace }}}}:/scan" \\
-          ${{{{ secrets.CODELOGIC_HOST }}}}/codelogic_{agent_type}:latest analyze \\
-          --application "{application_name}" \\
-          --path /scan \\
-          --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-          --rescan \\
-          --expunge-scan-sessions
+        # ⚠️ CRITICAL: CodeLogic scans must target BUILT ARTIFACTS, not source code
+        # Determine the artifact path from your build step output
+        # Examples:
+        # .NET: "bin/Release" or "publish"
+        # Java: "target" or "build/libs"
+        # JavaScript: "dist" or "build"
+        ARTIFACT_PATH="{scan_path}"  # Replace with your actual artifact directory
+        
+        echo "Scanning BUILT ARTIFACTS at: $ARTIFACT_PATH"
+        echo "NOT scanning source code - CodeLogic requires compiled binaries"
+        
+        {matrix_scan_command}
       continue-on-error: true
-      
-    - name: Capture build log
-      if: always()
-      run: |
-        mkdir -p logs
-        echo "Build completed at: $(date)" > logs/build.log
-        echo "Repository: ${{{{ github.repository }}}}" >> logs/build.log
-        echo "Workflow: ${{{{ github.workflow }}}}" >> logs/build.log
-        echo "Run Number: ${{{{ github.run_number }}}}" >> logs/build.log
-        echo "Commit: ${{{{ github.sha }}}}" >> logs/build.log
-        echo "Branch: ${{{{ github.ref_name }}}}" >> logs/build.log
-        echo "Build Status: ${{{{ job.status }}}}" >> logs/build.log
+
+  # Runs alongside the scan job (no needs:), so build info does not wait for the scan to finish
+  send-build-info:
+    runs-on: ubuntu-latest
+
+    steps:
+    - name: Checkout code
+      uses: actions/checkout@v4
+
+    # Only build info uses commit history; set CODELOGIC_NEEDS_HISTORY to 'true' to fetch more of it
+    - name: Deepen history
+      if: env.CODELOGIC_NEEDS_HISTORY == 'true'
+      run: git fetch --deepen=50
 
     - name: Send Build Info
       if: always()
@@ -1112,16 +1306,51 @@ jobs:
         pipeline_system: GitHub Actions
         log_file: /github/workspace/logs/build.log
         log_lines: 1000
-      continue-on-error: true"""
-                }
-            ]
-        },
-        "azure-devops": {
-            "file": "azure-pipelines.yml",
-            "modifications": [
-                {
-                    "type": "create_file",
-                    "content": f"""trigger:
+      continue-on-error: true
+      
+    - name: Upload build logs
+      uses: actions/upload-artifact@v4
+      if: always()
+      with:
+        name: build-logs
+        path: logs/
+        if-no-files-found: ignore
+        # Build logs are plain text and compress well
+        compression-level: 9
+        retention-days: ${{{{ github.ref == 'refs/heads/main' && 30 || 7 }}}}"""
+
+
+def _github_file_modifications(agent_type, scan_path, application_name, server_host, agent_image, image_digest=None, agent_types=None, runner_size="small"):
+    """GitHub Actions workflow for the CodeLogic scan"""
+    workflow = _github_scan_workflow(
+        agent_type, scan_path, application_name, tuple(agent_types or (agent_type,)),
+        1, runner_size, DEFAULT_PATHS_IGNORE, image_digest,
+    )
+    return {
+        "file": ".github/workflows/codelogic-scan.yml",
+        "modifications": [
+            {
+                "type": "create_file",
+                "content": workflow
+            }
+        ]
+    }
+
+
+def _azure_file_modifications(agent_type, scan_path, application_name, server_host, agent_image, image_digest=None):
+    """Azure DevOps pipeline stage for the CodeLogic scan"""
+    azure_scan_command = _analyze_command(
+        f"{_pull_option(image_digest)}--rm", _AZURE_VARIABLE_CREDENTIALS,
+        "$(Build.SourcesDirectory):/scan", _agent_image(f"$(codelogicHost)/codelogic_{agent_type}", image_digest),
+        application_name, "/scan", indent=" " * 10,
+    )
+    pull = _pull_option(image_digest, " \\\n" + " " * 10)
+    return {
+        "file": "azure-pipelines.yml",
+        "modifications": [
+            {
+                "type": "create_file",
+                "content": f"""trigger:
 - main
 - develop
 
@@ -1145,17 +1374,7 @@ stages:
       inputs:
         command: 'run'
         arguments: |
-          --pull always --rm \\
-          --env CODELOGIC_HOST="$(codelogicHost)" \\
-          --env AGENT_UUID="$(agentUuid)" \\
-          --env AGENT_PASSWORD="$(agentPassword)" \\
-          --volume "$(Build.SourcesDirectory):/scan" \\
-          $(codelogicHost)/codelogic_{agent_type}:latest analyze \\
-          --application "{application_name}" \\
-          --path /scan \\
-          --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-          --rescan \\
-          --expunge-scan-sessions
+          {azure_scan_command}
       continueOnError: true
       
     - task: Docker@2
@@ -1164,13 +1383,12 @@ stages:
       inputs:
         command: 'run'
         arguments: |
-          --pull always \\
-          --rm \\
+          {pull}--rm \\
           --env CODELOGIC_HOST="$(codelogicHost)" \\
           --env AGENT_UUID="$(agentUuid)" \\
           --env AGENT_PASSWORD="$(agentPassword)" \\
           --volume "$(Build.SourcesDirectory):/scan" \\
-          --volume "$(Build.SourcesDirectory)/logs:/log_file_path" \\
+          --volume "$(Build.SourcesDirectory)/logs:/log_file_path:ro" \\
           {SEND_BUILD_INFO_IMAGE} send_build_info \\
           --agent-uuid="$(agentUuid)" \\
           --agent-password="$(agentPassword)" \\
@@ -1191,15 +1409,25 @@ stages:
         pathToPublish: 'logs'
         artifactName: 'build-logs'
       condition: always()"""
-                }
-            ]
-        },
-        "gitlab": {
-            "file": ".gitlab-ci.yml",
-            "modifications": [
-                {
-                    "type": "create_file",
-                    "content": f"""stages:
+            }
+        ]
+    }
+
+
+def _gitlab_file_modifications(agent_type, scan_path, application_name, server_host, agent_image, image_digest=None):
+    """GitLab CI job for the CodeLogic scan"""
+    gitlab_scan_command = _analyze_command(
+        f"docker run {_pull_option(image_digest)}--rm", _SHELL_CREDENTIALS,
+        "$CI_PROJECT_DIR:/scan", _agent_image(f"$CODELOGIC_HOST/codelogic_{agent_type}", image_digest),
+        application_name, "/scan", indent=" " * 8,
+    )
+    pull = _pull_option(image_digest, " \\\n" + " " * 8)
+    return {
+        "file": ".gitlab-ci.yml",
+        "modifications": [
+            {
+                "type": "create_file",
+                "content": f"""stages:
   - scan
   - build-info
 
@@ -1209,24 +1437,12 @@ variables:
 
 codelogic_scan:
   stage: scan
-  image: docker:latest
+  image: docker:24-cli
   services:
-    - docker:dind
-  before_script:
-    - docker info
+    - docker:24-dind
   script:
     - |
-      docker run --pull always --rm \\
-        --env CODELOGIC_HOST="$CODELOGIC_HOST" \\
-        --env AGENT_UUID="$AGENT_UUID" \\
-        --env AGENT_PASSWORD="$AGENT_PASSWORD" \\
-        --volume "$CI_PROJECT_DIR:/scan" \\
-        $CODELOGIC_HOST/codelogic_{agent_type}:latest analyze \\
-        --application "{application_name}" \\
-        --path /scan \\
-        --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-        --rescan \\
-        --expunge-scan-sessions
+      {gitlab_scan_command}
   rules:
     - if: $CI_COMMIT_BRANCH == "main"
     - if: $CI_COMMIT_BRANCH == "develop"
@@ -1235,9 +1451,9 @@ codelogic_scan:
 
 send_build_info:
   stage: build-info
-  image: docker:latest
+  image: docker:24-cli
   services:
-    - docker:dind
+    - docker:24-dind
   script:
     - |
       # Create logs directory
@@ -1254,13 +1470,12 @@ send_build_info:
       
       # Send build info with proper command syntax
       docker run \\
-        --pull always \\
-        --rm \\
+        {pull}--rm \\
         --env CODELOGIC_HOST="$CODELOGIC_HOST" \\
         --env AGENT_UUID="$AGENT_UUID" \\
         --env AGENT_PASSWORD="$AGENT_PASSWORD" \\
         --volume "$CI_PROJECT_DIR:/scan" \\
-        --volume "$CI_PROJECT_DIR/logs:/log_file_path" \\
+        --volume "$CI_PROJECT_DIR/logs:/log_file_path:ro" \\
         {SEND_BUILD_INFO_IMAGE} send_build_info \\
         --agent-uuid="$AGENT_UUID" \\
         --agent-password="$AGENT_PASSWORD" \\
@@ -1281,112 +1496,174 @@ send_build_info:
     paths:
       - logs/
     expire_in: 30 days"""
-                }
-            ]
-        }
+            }
+        ]
     }
-    return modifications.get(ci_platform, {})
+
+
+# File modification builders for each platform, so only the requested
+# platform's templates are rendered
+_FILE_MODIFICATION_BUILDERS = {
+    "jenkins": _jenkins_file_modifications,
+    "github-actions": _github_file_modifications,
+    "azure-devops": _azure_file_modifications,
+    "gitlab": _gitlab_file_modifications,
+}
+
+
+def generate_file_modifications(ci_platform, agent_type, scan_path, application_name, server_host, agent_image, image_digest=None, agent_types=None, runner_size="small"):
+    """Generate specific file modifications for each platform"""
+    builder = _FILE_MODIFICATION_BUILDERS.get(ci_platform)
+    if builder is None:
+        return {}
+    if ci_platform == "github-actions":
+        # Same workflow file as the platform guide, so both copies match
+        return builder(agent_type, scan_path, application_name, server_host, agent_image, image_digest, agent_types, runner_size)
+    return builder(agent_type, scan_path, application_name, server_host, agent_image, image_digest)
+
+
+# Credential and pipeline setup steps for each platform
+_SETUP_INSTRUCTIONS: dict[str, tuple[str, ...]] = {
+    "jenkins": (
+        "1. Go to Jenkins → Manage Jenkins → Manage Credentials",
+        "2. Add Secret Text credentials: codelogic-agent-uuid, codelogic-agent-password",
+        "3. Install Docker Pipeline Plugin if not already installed",
+        "4. Configure build triggers for main, develop, and feature branches",
+        "5. Test the pipeline with a sample build"
+    ),
+    "github-actions": (
+        "1. Go to repository Settings → Secrets and variables → Actions",
+        "2. Add repository secrets: CODELOGIC_HOST, AGENT_UUID, AGENT_PASSWORD",
+        "3. Ensure Docker is available in runner (default for ubuntu-latest)",
+        "4. Configure branch triggers for main, develop, and feature branches",
+        "5. Test the workflow with a sample commit"
+    ),
+    "azure-devops": (
+        "1. Go to pipeline variables and add: codelogicAgentUuid, codelogicAgentPassword",
+        "2. Mark variables as secret",
+        "3. Ensure Docker task is available",
+        "4. Configure build triggers for main, develop, and feature branches",
+        "5. Test the pipeline with a sample build"
+    ),
+    "gitlab": (
+        "1. Go to Settings → CI/CD → Variables",
+        "2. Add variables: AGENT_UUID, AGENT_PASSWORD",
+        "3. Mark as protected and masked",
+        "4. Ensure Docker-in-Docker is enabled",
+        "5. Configure branch rules for main, develop, and feature branches",
+        "6. Test the pipeline with a sample commit"
+    )
+}
 
 
 def generate_setup_instructions(ci_platform):
     """Generate setup instructions for each platform"""
-    instructions = {
-        "jenkins": [
-            "1. Go to Jenkins → Manage Jenkins → Manage Credentials",
-            "2. Add Secret Text credentials: codelogic-agent-uuid, codelogic-agent-password",
-            "3. Install Docker Pipeline Plugin if not already installed",
-            "4. Configure build triggers for main, develop, and feature branches",
-            "5. Test the pipeline with a sample build"
-        ],
-        "github-actions": [
-            "1. Go to repository Settings → Secrets and variables → Actions",
-            "2. Add repository secrets: CODELOGIC_HOST, AGENT_UUID, AGENT_PASSWORD",
-            "3. Ensure Docker is available in runner (default for ubuntu-latest)",
-            "4. Configure branch triggers for main, develop, and feature branches",
-            "5. Test the workflow with a sample commit"
-        ],
-        "azure-devops": [
-            "1. Go to pipeline variables and add: codelogicAgentUuid, codelogicAgentPassword",
-            "2. Mark variables as secret",
-            "3. Ensure Docker task is available",
-            "4. Configure build triggers for main, develop, and feature branches",
-            "5. Test the pipeline with a sample build"
-        ],
-        "gitlab": [
-            "1. Go to Settings → CI/CD → Variables",
-            "2. Add variables: AGENT_UUID, AGENT_PASSWORD",
-            "3. Mark as protected and masked",
-            "4. Ensure Docker-in-Docker is enabled",
-            "5. Configure branch rules for main, develop, and feature branches",
-            "6. Test the pipeline with a sample commit"
-        ]
-    }
-    return instructions.get(ci_platform, [])
+    return _SETUP_INSTRUCTIONS.get(ci_platform, ())
+
+
+# Post-setup checks for each platform
+_VALIDATION_CHECKS: dict[str, tuple[str, ...]] = {
+    "jenkins": (
+        "Verify credentials are properly configured",
+        "Test Docker command manually",
+        "Check Jenkins agent has Docker access"
+    ),
+    "github-actions": (
+        "Verify secrets are set correctly",
+        "Test workflow runs without errors",
+        "Check Docker is available in runner"
+    ),
+    "azure-devops": (
+        "Verify variables are marked as secret",
+        "Test Docker task execution",
+        "Check pipeline permissions"
+    ),
+    "gitlab": (
+        "Verify variables are protected and masked",
+        "Test Docker-in-Docker functionality",
+        "Check pipeline permissions"
+    )
+}
 
 
 def generate_validation_checks(ci_platform):
     """Generate validation checks for each platform"""
-    checks = {
-        "jenkins": [
-            "Verify credentials are properly configured",
-            "Test Docker command manually",
-            "Check Jenkins agent has Docker access"
-        ],
-        "github-actions": [
-            "Verify secrets are set correctly",
-            "Test workflow runs without errors",
-            "Check Docker is available in runner"
-        ],
-        "azure-devops": [
-            "Verify variables are marked as secret",
-            "Test Docker task execution",
-            "Check pipeline permissions"
-        ],
-        "gitlab": [
-            "Verify variables are protected and masked",
-            "Test Docker-in-Docker functionality",
-            "Check pipeline permissions"
-        ]
-    }
-    return checks.get(ci_platform, [])
+    return _VALIDATION_CHECKS.get(ci_platform, ())
 
 
 def format_target_files(target_files):
     """Format target files for display"""
-    if isinstance(target_files, list):
-        return "\n".join([f"- `{file}`" for file in target_files])
+    if isinstance(target_files, (list, tuple)):
+        return "\n".join(f"- `{file}`" for file in target_files)
     return f"- `{target_files}`"
 
 
 def format_environment_variables(env_vars):
     """Format environment variables for display"""
-    return "\n".join([f"- `{key}`: {value}" for key, value in env_vars.items()])
+    return "\n".join(f"- `{key}`: {value}" for key, value in env_vars.items())
 
 
 def format_file_modifications(modifications):
     """Format file modifications for display"""
     if not modifications:
         return "No specific modifications required."
-    
-    result = []
-    for mod in modifications.get('modifications', []):
-        result.append(f"**{mod['type'].replace('_', ' ').title()}**: {mod.get('location', 'N/A')}")
-        result.append(f"```\n{mod['content']}\n```")
-    
-    return "\n".join(result)
+
+    return "\n".join(
+        f"**{mod['type'].replace('_', ' ').title()}**: {mod.get('location', 'N/A')}\n```\n{mod['content']}\n```"
+        for mod in modifications.get('modifications', [])
+    )
 
 
 def format_setup_instructions(instructions):
     """Format setup instructions for display"""
-    return "\n".join([f"{i+1}. {instruction}" for i, instruction in enumerate(instructions)])
+    return "\n".join(f"{i}. {instruction}" for i, instruction in enumerate(instructions, 1))
 
 
 def format_validation_checks(checks):
     """Format validation checks for display"""
-    return "\n".join([f"- {check}" for check in checks])
+    return "\n".join(f"- {check}" for check in checks)
+
+
+def _jenkins_parallel_scan_stage(agent_types, scan_path, application_name):
+    """Render a CodeLogic Scan stage with one parallel branch per agent type"""
+    branches = "".join(f"""
+        stage('CodeLogic Scan - {t}') {{
+            steps {{
+                sh '''
+                    ARTIFACT_PATH="{scan_path}"  # Replace with your actual artifact directory
+
+                    {_analyze_command("docker run --rm --interactive", _BRACED_SHELL_CREDENTIALS, "${WORKSPACE}:/workspace", _agent_image(f"${{CODELOGIC_HOST}}/codelogic_{t}"), application_name, '"/workspace/$ARTIFACT_PATH"', indent=" " * 24)}
+                '''
+            }}
+        }}""" for t in agent_types)
+    pulls = "".join(f"""
+            docker pull --quiet {_agent_image(f"${{CODELOGIC_HOST}}/codelogic_{t}")} || true""" for t in agent_types)
+    return f"""
+### 🔀 Scanning Multiple Agent Types in Parallel
+
+**AI Prompt: "Scan {', '.join(agent_types)} artifacts in parallel Jenkins stages"**
+
+Replace the single-agent `stage('CodeLogic Scan')` with these stages. The agent images are pulled once up front so the parallel branches reuse the daemon's cached layers. Each agent type runs in its own parallel branch, and `failFast false` keeps one agent's failure from stopping the others:
+
+```groovy
+stage('Warm image cache') {{
+    steps {{
+        sh '''{pulls}
+        '''
+    }}
+}}
+
+stage('CodeLogic Scan') {{
+    failFast false
+    parallel {{{branches}
+    }}
+}}
+```
+"""
 
 
-def generate_jenkins_config(agent_type, scan_path, application_name, server_host):
+@lru_cache(maxsize=128)
+def generate_jenkins_config(agent_type, scan_path, application_name, server_host, agent_types=None, image_digest=None):
     """Generate Jenkins-specific configuration with AI modification prompts"""
     
     # Technology-specific guidance based on agent type
@@ -1416,7 +1693,17 @@ def generate_jenkins_config(agent_type, scan_path, application_name, server_host
     
     tech_info = tech_guidance.get(agent_type, tech_guidance['java'])  # Default to Java
     
-    return f"""
+    scan_command = _analyze_command(
+        "docker run --rm --interactive", _BRACED_SHELL_CREDENTIALS,
+        "${WORKSPACE}:/workspace", "${CODELOGIC_IMAGE}",
+        application_name, '"/workspace/$ARTIFACT_PATH"', scan_space_name='"$SCAN_SPACE"', indent=" " * 20,
+    )
+    template_scan_command = _analyze_command(
+        "docker run --rm --interactive", _BRACED_SHELL_CREDENTIALS,
+        "${WORKSPACE}:/workspace", _agent_image(f"${{CODELOGIC_HOST}}/codelogic_{agent_type}", image_digest),
+        application_name, '"/workspace/$ARTIFACT_PATH"', indent=" " * 28,
+    )
+    config = f"""
 ### 🎯 Jenkins File Modification Guide
 
 **AI Prompt: "Modify the Jenkinsfile to add CodeLogic scanning for {agent_type.upper()} applications"**
@@ -1513,7 +1800,7 @@ Add this to the `environment` block in your Jenkinsfile:
 ```groovy
 environment {{
     CODELOGIC_HOST = '{server_host}'
-    CODELOGIC_IMAGE = '${{CODELOGIC_HOST}}/codelogic_{agent_type}:latest'
+    CODELOGIC_IMAGE = '{_agent_image(f"${{CODELOGIC_HOST}}/codelogic_{agent_type}", image_digest)}'
     SEND_BUILD_INFO_IMAGE = '{SEND_BUILD_INFO_IMAGE}'
     AGENT_UUID = credentials('codelogic-agent-uuid')
     AGENT_PASSWORD = credentials('codelogic-agent-password')
@@ -1802,7 +2089,7 @@ stage('CodeLogic Build Info Collection') {{
                     --env AGENT_UUID="${{AGENT_UUID}}" \\
                     --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
                     --volume "${{WORKSPACE}}:/scan" \\
-                    --volume "${{WORKSPACE}}/logs:/log_file_path" \\
+                    --volume "${{WORKSPACE}}/logs:/log_file_path:ro" \\
                     {SEND_BUILD_INFO_IMAGE} send_build_info \\
                     --agent-uuid="${{AGENT_UUID}}" \\
                     --agent-password="${{AGENT_PASSWORD}}" \\
@@ -1892,17 +2179,7 @@ stage('CodeLogic Scan') {{
                 echo "Scan Space: $SCAN_SPACE"
                 echo "Target Path: $ARTIFACT_PATH (BUILT ARTIFACTS)"
                 
-                docker run --pull always --rm --interactive \\
-                    --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
-                    --env AGENT_UUID="${{AGENT_UUID}}" \\
-                    --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
-                    --volume "${{WORKSPACE}}:/workspace" \\
-                    ${{CODELOGIC_IMAGE}} analyze \\
-                    --application "{application_name}" \\
-                    --path "/workspace/$ARTIFACT_PATH" \\
-                    --scan-space-name "$SCAN_SPACE" \\
-                    --rescan \\
-                    --expunge-scan-sessions
+                {scan_command}
             '''
         }}
     }}
@@ -1940,6 +2217,14 @@ pipeline {{
         AGENT_PASSWORD = credentials('codelogic-agent-password')
     }}
     
+    options {{
+        // Free the executor if an image pull or scan hangs
+        timeout(time: 30, unit: 'MINUTES')
+        // Abort the superseded build when a newer commit starts on the same branch
+        disableConcurrentBuilds(abortPrevious: true)
+        buildDiscarder(logRotator(numToKeepStr: '20'))
+    }}
+    
     stages {{
         stage('Build') {{
             steps {{
@@ -1974,17 +2259,7 @@ pipeline {{
                         # Use artifact path (built artifacts, not source code)
                         ARTIFACT_PATH="{scan_path}"  # Replace with your actual artifact directory
                         
-                        docker run --pull always --rm --interactive \\
-                            --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
-                            --env AGENT_UUID="${{AGENT_UUID}}" \\
-                            --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
-                            --volume "${{WORKSPACE}}:/workspace" \\
-                            ${{CODELOGIC_HOST}}/codelogic_{agent_type}:latest analyze \\
-                            --application "{application_name}" \\
-                            --path "/workspace/$ARTIFACT_PATH" \\
-                            --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-                            --rescan \\
-                            --expunge-scan-sessions
+                        {template_scan_command}
                     '''
                 }}
             }}
@@ -1997,9 +2272,10 @@ pipeline {{
                         --env CODELOGIC_HOST="${{CODELOGIC_HOST}}" \\
                         --env AGENT_UUID="${{AGENT_UUID}}" \\
                         --env AGENT_PASSWORD="${{AGENT_PASSWORD}}" \\
-                        --volume "${{WORKSPACE}}/logs:/log_file_path" \\
+                        --volume "${{WORKSPACE}}/logs:/log_file_path:ro" \\
                         {SEND_BUILD_INFO_IMAGE} send_build_info \\
-                        --log-file="/log_file_path/build.log"
+                        --log-file="/log_file_path/build.log" \\
+                        --log-lines=1000
                 '''
             }}
         }}
@@ -2019,10 +2295,32 @@ pipeline {{
 }}
 ```
 """
+    if agent_types and len(agent_types) > 1:
+        config += _jenkins_parallel_scan_stage(agent_types, scan_path, application_name)
+    return config
 
 
-def generate_github_actions_config(agent_type, scan_path, application_name, server_host):
+@lru_cache(maxsize=128)
+def generate_github_actions_config(agent_type, scan_path, application_name, server_host, agent_types=None, fetch_depth=1, runner_size="small", paths_ignore=DEFAULT_PATHS_IGNORE, image_digest=None):
     """Generate GitHub Actions configuration with AI modification prompts"""
+    paths_ignore_yaml = "[ " + ", ".join(f"'{path}'" for path in paths_ignore) + " ]"
+    scan_runner = GITHUB_RUNNERS.get(runner_size, GITHUB_RUNNERS["small"])
+    workflow = _github_scan_workflow(
+        agent_type, scan_path, application_name, tuple(agent_types or (agent_type,)),
+        fetch_depth, runner_size, tuple(paths_ignore), image_digest,
+    )
+    agent_image = _agent_image(f"${{{{ secrets.CODELOGIC_HOST }}}}/codelogic_{agent_type}", image_digest)
+    scan_command = _analyze_command(
+        f"docker run {_pull_option(image_digest)}--rm", _GITHUB_SECRET_CREDENTIALS,
+        "${{ github.workspace }}:/scan", agent_image,
+        application_name, "/scan", indent=" " * 6,
+    )
+    image_cache_steps = _github_image_cache_steps(agent_type, agent_image, image_digest)
+    template_scan_command = _analyze_command(
+        "docker run --rm", _GITHUB_SECRET_CREDENTIALS,
+        "${{ github.workspace }}:/workspace", agent_image,
+        application_name, '"/workspace/$ARTIFACT_PATH"', indent=" " * 10,
+    )
     return f"""
 ### 🎯 GitHub Actions File Modification Guide
 
@@ -2043,73 +2341,7 @@ def generate_github_actions_config(agent_type, scan_path, application_name, serv
 Create `.github/workflows/codelogic-scan.yml`:
 
 ```yaml
-name: CodeLogic Scan
-
-on:
-  push:
-    branches: [ main, develop, feature/* ]
-  pull_request:
-    branches: [ main ]
-
-jobs:
-  codelogic-scan:
-    runs-on: ubuntu-latest
-    
-    steps:
-    - name: Checkout code
-      uses: actions/checkout@v4
-      with:
-        fetch-depth: 0
-      
-    - name: CodeLogic Scan
-      run: |
-        # ⚠️ CRITICAL: CodeLogic scans must target BUILT ARTIFACTS, not source code
-        # Determine the artifact path from your build step output
-        # Examples:
-        # .NET: "bin/Release" or "publish"
-        # Java: "target" or "build/libs"
-        # JavaScript: "dist" or "build"
-        ARTIFACT_PATH="{scan_path}"  # Replace with your actual artifact directory
-        
-        echo "Scanning BUILT ARTIFACTS at: $ARTIFACT_PATH"
-        echo "NOT scanning source code - CodeLogic requires compiled binaries"
-        
-        docker run --pull always --rm \\
-          --env CODELOGIC_HOST="${{{{ secrets.CODELOGIC_HOST }}}}" \\
-          --env AGENT_UUID="${{{{ secrets.AGENT_UUID }}}}" \\
-          --env AGENT_PASSWORD="${{{{ secrets.AGENT_PASSWORD }}}}" \\
-          --volume "${{{{ github.workspace }}}}:/workspace" \\
-          ${{{{ secrets.CODELOGIC_HOST }}}}/codelogic_{agent_type}:latest analyze \\
-          --application "{application_name}" \\
-          --path "/workspace/$ARTIFACT_PATH" \\
-          --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-          --rescan \\
-          --expunge-scan-sessions
-      continue-on-error: true
-      
-    - name: Send Build Info
-      if: always()
-      uses: {SEND_BUILD_INFO_GITHUB_ACTION}
-      with:
-        codelogic_host: ${{{{ secrets.CODELOGIC_HOST }}}}
-        agent_uuid: ${{{{ secrets.AGENT_UUID }}}}
-        agent_password: ${{{{ secrets.AGENT_PASSWORD }}}}
-        scan_path: /github/workspace
-        job_name: ${{{{ github.workflow }}}}
-        build_number: ${{{{ github.run_number }}}}
-        build_status: ${{{{ job.status }}}}
-        pipeline_system: GitHub Actions
-        log_file: /github/workspace/logs/build.log
-        log_lines: 1000
-      continue-on-error: true
-      
-    - name: Upload build logs
-      uses: actions/upload-artifact@v4
-      if: always()
-      with:
-        name: build-logs
-        path: logs/
-        retention-days: 30
+{workflow}
 ```
 
 #### Step 3: Modify Existing Workflow
@@ -2121,17 +2353,7 @@ If you have an existing workflow, add these steps:
 # Add to your existing workflow
 - name: CodeLogic Scan
   run: |
-    docker run --pull always --rm \\
-      --env CODELOGIC_HOST="${{{{ secrets.CODELOGIC_HOST }}}}" \\
-      --env AGENT_UUID="${{{{ secrets.AGENT_UUID }}}}" \\
-      --env AGENT_PASSWORD="${{{{ secrets.AGENT_PASSWORD }}}}" \\
-      --volume "${{{{ github.workspace }}}}:/scan" \\
-      ${{{{ secrets.CODELOGIC_HOST }}}}/codelogic_{agent_type}:latest analyze \\
-      --application "{application_name}" \\
-      --path /scan \\
-      --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-      --rescan \\
-      --expunge-scan-sessions
+    {scan_command}
   continue-on-error: true
 ```
 
@@ -2162,12 +2384,19 @@ name: CI/CD Pipeline with CodeLogic
 on:
   push:
     branches: [ main, develop, feature/* ]
+    paths-ignore: {paths_ignore_yaml}
   pull_request:
     branches: [ main ]
+    paths-ignore: {paths_ignore_yaml}
+
+# Cancel superseded pull request runs; pushes to main/develop always finish
+concurrency:
+  group: codelogic-${{{{ github.workflow }}}}-${{{{ github.ref }}}}
+  cancel-in-progress: ${{{{ github.event_name == 'pull_request' }}}}
 
 jobs:
   build-and-test:
-    runs-on: ubuntu-latest
+    runs-on: {scan_runner}
     
     steps:
     - name: Checkout code
@@ -2187,6 +2416,8 @@ jobs:
     - name: Test
       run: dotnet test --no-build --verbosity normal
       
+{image_cache_steps}
+
     - name: CodeLogic Scan
       run: |
         # ⚠️ CRITICAL: CodeLogic scans must target BUILT ARTIFACTS, not source code
@@ -2200,17 +2431,7 @@ jobs:
         echo "Scanning BUILT ARTIFACTS at: $ARTIFACT_PATH"
         echo "NOT scanning source code - CodeLogic requires compiled binaries"
         
-        docker run --pull always --rm \\
-          --env CODELOGIC_HOST="${{{{ secrets.CODELOGIC_HOST }}}}" \\
-          --env AGENT_UUID="${{{{ secrets.AGENT_UUID }}}}" \\
-          --env AGENT_PASSWORD="${{{{ secrets.AGENT_PASSWORD }}}}" \\
-          --volume "${{{{ github.workspace }}}}:/workspace" \\
-          ${{{{ secrets.CODELOGIC_HOST }}}}/codelogic_{agent_type}:latest analyze \\
-          --application "{application_name}" \\
-          --path "/workspace/$ARTIFACT_PATH" \\
-          --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-          --rescan \\
-          --expunge-scan-sessions
+        {template_scan_command}
       continue-on-error: true
       
     - name: Send Build Info
@@ -2235,13 +2456,23 @@ jobs:
       with:
         name: build-logs
         path: logs/
-        retention-days: 30
+        if-no-files-found: ignore
+        # Build logs are plain text and compress well
+        compression-level: 9
+        retention-days: ${{{{ github.ref == 'refs/heads/main' && 30 || 7 }}}}
 ```
 """
 
 
-def generate_azure_devops_config(agent_type, scan_path, application_name, server_host):
+@lru_cache(maxsize=128)
+def generate_azure_devops_config(agent_type, scan_path, application_name, server_host, image_digest=None):
     """Generate Azure DevOps configuration"""
+    scan_command = _analyze_command(
+        f"{_pull_option(image_digest)}--rm", _AZURE_VARIABLE_CREDENTIALS,
+        "$(Build.SourcesDirectory):/workspace", _agent_image(f"$(codelogicHost)/codelogic_{agent_type}", image_digest),
+        application_name, f'"/workspace/{scan_path}"', indent=" " * 10,
+    )
+    pull = _pull_option(image_digest, " \\\n" + " " * 10)
     return f"""
 ### Azure DevOps Pipeline
 
@@ -2249,8 +2480,12 @@ Create `azure-pipelines.yml`:
 
 ```yaml
 trigger:
-- main
-- develop
+  # Batch pushes that arrive while a run is in progress into a single follow-up run
+  batch: true
+  branches:
+    include:
+    - main
+    - develop
 
 pool:
   vmImage: 'ubuntu-latest'
@@ -2278,32 +2513,25 @@ stages:
           # .NET: "bin/Release" or "publish"
           # Java: "target" or "build/libs"
           # JavaScript: "dist" or "build"
-          --pull always --rm \\
-          --env CODELOGIC_HOST="$(codelogicHost)" \\
-          --env AGENT_UUID="$(agentUuid)" \\
-          --env AGENT_PASSWORD="$(agentPassword)" \\
-          --volume "$(Build.SourcesDirectory):/workspace" \\
-          $(codelogicHost)/codelogic_{agent_type}:latest analyze \\
-          --application "{application_name}" \\
-          --path "/workspace/{scan_path}" \\
-          --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-          --rescan \\
-          --expunge-scan-sessions
+          {scan_command}
       continueOnError: true
-      
+
+  # No dependsOn, so build info is sent in parallel with the scan
+  - job: SendBuildInfo
+    displayName: 'Send Build Info'
+    steps:
     - task: Docker@2
       displayName: 'Send Build Info'
       condition: always()
       inputs:
         command: 'run'
         arguments: |
-          --pull always \\
-          --rm \\
+          {pull}--rm \\
           --env CODELOGIC_HOST="$(codelogicHost)" \\
           --env AGENT_UUID="$(agentUuid)" \\
           --env AGENT_PASSWORD="$(agentPassword)" \\
           --volume "$(Build.SourcesDirectory):/scan" \\
-          --volume "$(Build.SourcesDirectory)/logs:/log_file_path" \\
+          --volume "$(Build.SourcesDirectory)/logs:/log_file_path:ro" \\
           {SEND_BUILD_INFO_IMAGE} send_build_info \\
           --agent-uuid="$(agentUuid)" \\
           --agent-password="$(agentPassword)" \\
@@ -2334,8 +2562,36 @@ Add these variables to your pipeline:
 """
 
 
-def generate_gitlab_config(agent_type, scan_path, application_name, server_host):
+@lru_cache(maxsize=128)
+def generate_gitlab_config(agent_type, scan_path, application_name, server_host, image_digest=None):
     """Generate GitLab CI configuration"""
+    agent_image = _agent_image(f"$CODELOGIC_HOST/codelogic_{agent_type}", image_digest)
+    scan_command = _analyze_command(
+        "docker run --rm", _SHELL_CREDENTIALS,
+        "$CI_PROJECT_DIR:/workspace", agent_image,
+        application_name, '"/workspace/$ARTIFACT_PATH"', indent=" " * 8,
+    )
+    # Key the cached tarball on the pinned digest so pinning a new one refreshes it
+    cache_key = f"codelogic-{agent_type}-{image_digest[:12]}" if image_digest else f"codelogic-{agent_type}-image"
+    if image_digest:
+        load_image = """if [ -f .codelogic-image.tar ]; then
+        docker load -i .codelogic-image.tar
+      else
+        docker pull "$CODELOGIC_IMAGE"
+        docker save "$CODELOGIC_IMAGE" -o .codelogic-image.tar
+      fi"""
+    else:
+        load_image = """if [ -f .codelogic-image.tar ]; then
+        docker load -i .codelogic-image.tar
+      fi
+      CACHED_IMAGE_ID=$(docker image inspect --format '{{.Id}}' "$CODELOGIC_IMAGE" 2>/dev/null || true)
+      # Refresh the unpinned image; only changed layers are downloaded, and a
+      # failed pull falls back to the cached image
+      docker pull --quiet "$CODELOGIC_IMAGE" || true
+      if [ "$(docker image inspect --format '{{.Id}}' "$CODELOGIC_IMAGE")" != "$CACHED_IMAGE_ID" ]; then
+        docker save "$CODELOGIC_IMAGE" -o .codelogic-image.tar
+      fi"""
+    pull = _pull_option(image_digest, " \\\n" + " " * 8)
     return f"""
 ### GitLab CI Configuration
 
@@ -2352,11 +2608,18 @@ variables:
 
 codelogic_scan:
   stage: scan
-  image: docker:latest
+  image: docker:24-cli
   services:
-    - docker:dind
+    - docker:24-dind
+  cache:
+    # Unpinned images are refreshed by the before_script pull; a new digest gets a new key
+    key: {cache_key}
+    paths:
+      - .codelogic-image.tar
   before_script:
-    - docker info
+    - |
+      CODELOGIC_IMAGE="{agent_image}"
+      {load_image}
   script:
     - |
       # ⚠️ CRITICAL: CodeLogic scans must target BUILT ARTIFACTS, not source code
@@ -2370,38 +2633,30 @@ codelogic_scan:
       echo "Scanning BUILT ARTIFACTS at: $ARTIFACT_PATH"
       echo "NOT scanning source code - CodeLogic requires compiled binaries"
       
-      docker run --pull always --rm \\
-        --env CODELOGIC_HOST="$CODELOGIC_HOST" \\
-        --env AGENT_UUID="$AGENT_UUID" \\
-        --env AGENT_PASSWORD="$AGENT_PASSWORD" \\
-        --volume "$CI_PROJECT_DIR:/workspace" \\
-        $CODELOGIC_HOST/codelogic_{agent_type}:latest analyze \\
-        --application "{application_name}" \\
-        --path "/workspace/$ARTIFACT_PATH" \\
-        --scan-space-name "YOUR_SCAN_SPACE_NAME" \\
-        --rescan \\
-        --expunge-scan-sessions
+      {scan_command}
   rules:
     - if: $CI_COMMIT_BRANCH == "main"
     - if: $CI_COMMIT_BRANCH == "develop"
     - if: $CI_COMMIT_BRANCH =~ /^feature\\/.*$/
   allow_failure: true
+  interruptible: true
 
 send_build_info:
   stage: build-info
-  image: docker:latest
+  # needs: [] starts this job right away instead of waiting for the scan stage
+  needs: []
+  image: docker:24-cli
   services:
-    - docker:dind
+    - docker:24-dind
   script:
     - |
       docker run \\
-        --pull always \\
-        --rm \\
+        {pull}--rm \\
         --env CODELOGIC_HOST="$CODELOGIC_HOST" \\
         --env AGENT_UUID="$AGENT_UUID" \\
         --env AGENT_PASSWORD="$AGENT_PASSWORD" \\
         --volume "$CI_PROJECT_DIR:/scan" \\
-        --volume "$CI_PROJECT_DIR/logs:/log_file_path" \\
+        --volume "$CI_PROJECT_DIR/logs:/log_file_path:ro" \\
         {SEND_BUILD_INFO_IMAGE} send_build_info \\
         --agent-uuid="$AGENT_UUID" \\
         --agent-password="$AGENT_PASSWORD" \\
@@ -2418,6 +2673,7 @@ send_build_info:
     - if: $CI_COMMIT_BRANCH == "main"
     - if: $CI_COMMIT_BRANCH == "develop"
   allow_failure: true
+  interruptible: true
 ```
 
 ### GitLab Variables
@@ -2428,8 +2684,14 @@ Add these variables to your project:
 """
 
 
-def generate_generic_config(agent_type, scan_path, application_name, server_host):
+@lru_cache(maxsize=128)
+def generate_generic_config(agent_type, scan_path, application_name, server_host, image_digest=None):
     """Generate generic configuration for any CI/CD platform"""
+    scan_command = _analyze_command(
+        "docker run --rm --interactive", _SHELL_CREDENTIALS,
+        "$SCAN_PATH:/scan", '"$CODELOGIC_IMAGE"',
+        "$APPLICATION_NAME", "/scan", scan_space_name='"$SCAN_SPACE"', indent=" " * 4,
+    )
     return f"""
 ### Generic CI/CD Configuration
 
@@ -2456,20 +2718,24 @@ AGENT_PASSWORD="${{AGENT_PASSWORD}}"
 SCAN_PATH="${{SCAN_PATH:-{scan_path}}}"
 APPLICATION_NAME="${{APPLICATION_NAME:-{application_name}}}"
 SCAN_SPACE="${{SCAN_SPACE:-YOUR_SCAN_SPACE_NAME}}"
+CODELOGIC_IMAGE="{_agent_image(f"$CODELOGIC_HOST/codelogic_{agent_type}", image_digest)}"
+
+# Refresh the agent image; only changed layers are downloaded, and a failed
+# pull falls back to the locally cached image
+docker pull --quiet "$CODELOGIC_IMAGE" || true
 
 # Run CodeLogic scan
 echo "Starting CodeLogic {agent_type} scan..."
-docker run --pull always --rm --interactive \\
-    --env CODELOGIC_HOST="$CODELOGIC_HOST" \\
-    --env AGENT_UUID="$AGENT_UUID" \\
-    --env AGENT_PASSWORD="$AGENT_PASSWORD" \\
-    --volume "$SCAN_PATH:/scan" \\
-    $CODELOGIC_HOST/codelogic_{agent_type}:latest analyze \\
-    --application "$APPLICATION_NAME" \\
-    --path /scan \\
-    --scan-space-name "$SCAN_SPACE" \\
-    --rescan \\
-    --expunge-scan-sessions
+{scan_command}
 
 echo "CodeLogic scan completed successfully"
 """
+
+
+# Platform-specific pipeline generators used by _render_docker_agent_config
+_PLATFORM_CONFIG_GENERATORS = {
+    "jenkins": generate_jenkins_config,
+    "github-actions": generate_github_actions_config,
+    "azure-devops": generate_azure_devops_config,
+    "gitlab": generate_gitlab_config,
+}
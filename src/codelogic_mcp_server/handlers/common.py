@@ -7,13 +7,13 @@
 Common utilities and shared functions for CodeLogic MCP handlers.
 """
 
-import json
+import logging
 import os
-import sys
 import tempfile
 from datetime import datetime
-import time
+import orjson
 
+logger = logging.getLogger(__name__)
 
 DEBUG_MODE = os.getenv("CODELOGIC_DEBUG_MODE", "false").lower() == "true"
 
@@ -29,6 +29,9 @@ LOGS_DIR = os.path.join(tempfile.gettempdir(), "codelogic-mcp-server")
 if DEBUG_MODE:
     os.makedirs(LOGS_DIR, exist_ok=True)
 
+# Timing log is opened once (line buffered) rather than reopened for every event
+_timing_log = open(os.path.join(LOGS_DIR, "timing_log.txt"), "a", buffering=1) if DEBUG_MODE else None
+
 
 def ensure_logs_dir():
     """Ensure the logs directory exists when needed for debug mode."""
@@ -40,7 +43,7 @@ def get_workspace_name():
     """Get the CodeLogic workspace name from environment variable with fallback."""
     workspace_name = os.getenv("CODELOGIC_WORKSPACE_NAME")
     if not workspace_name:
-        sys.stderr.write("Warning: CODELOGIC_WORKSPACE_NAME environment variable not set. Using default workspace.\n")
+        logger.warning("CODELOGIC_WORKSPACE_NAME environment variable not set. Using default workspace.")
         workspace_name = "default-workspace"
     return workspace_name
 
@@ -48,17 +51,21 @@ def get_workspace_name():
 def write_json_to_file(file_path, data):
     """Write JSON data to a file with improved formatting."""
     ensure_logs_dir()
-    with open(file_path, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4, separators=(", ", ": "), ensure_ascii=False, sort_keys=True)
+    with open(file_path, "wb") as file:
+        file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+
+
+def log_and_raise(message):
+    """Log a validation error and raise it as a ValueError."""
+    logger.error("%s", message)
+    raise ValueError(message)
 
 
 def log_timing(operation, duration, details=""):
     """Log timing information for operations."""
     if DEBUG_MODE:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ensure_logs_dir()
-        with open(os.path.join(LOGS_DIR, "timing_log.txt"), "a") as log_file:
-            log_file.write(f"{timestamp} - {operation} took {duration:.4f} seconds {details}\n")
+        _timing_log.write(f"{timestamp} - {operation} took {duration:.4f} seconds {details}\n")
 
 
 def generate_send_build_info_command(
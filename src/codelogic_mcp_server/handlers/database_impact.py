@@ -7,47 +7,50 @@
 Handler for the codelogic-database-impact tool.
 """
 
-import json
+import asyncio
+import logging
 import os
-import sys
 import time
 import mcp.types as types
-from .common import get_workspace_name, write_json_to_file, log_timing, DEBUG_MODE, LOGS_DIR
+from .common import get_workspace_name, write_json_to_file, log_timing, log_and_raise, DEBUG_MODE, LOGS_DIR
 from ..utils import search_database_entity, get_impact, process_database_entity_impact, generate_combined_database_report
 
+logger = logging.getLogger(__name__)
+
+# Database entity types accepted by the codelogic-database-impact tool
+VALID_ENTITY_TYPES = frozenset({"column", "table", "view"})
+
+# Debug dump path for each entity's impact data, formatted with (entity_type, entity_name)
+IMPACT_JSON_PATH_TEMPLATE = os.path.join(LOGS_DIR, "impact_data_{}_{}.json")
+
 
 async def handle_database_impact(arguments: dict | None) -> list[types.TextContent]:
     """Handle the database-impact tool for database entity analysis"""
     if not arguments:
-        sys.stderr.write("Missing arguments\n")
-        raise ValueError("Missing arguments")
+        log_and_raise("Missing arguments")
 
     entity_type = arguments.get("entity_type")
     name = arguments.get("name")
     table_or_view = arguments.get("table_or_view")
 
     if not entity_type or not name:
-        sys.stderr.write("Entity type and name must be provided\n")
-        raise ValueError("Entity type and name must be provided")
+        log_and_raise("Entity type and name must be provided")
 
-    if entity_type not in ["column", "table", "view"]:
-        sys.stderr.write(f"Invalid entity type: {entity_type}. Must be column, table, or view.\n")
-        raise ValueError(f"Invalid entity type: {entity_type}")
+    if entity_type not in VALID_ENTITY_TYPES:
+        log_and_raise(f"Invalid entity type: {entity_type}. Must be column, table, or view.")
 
     # Verify table_or_view is provided for columns
     if entity_type == "column" and not table_or_view:
-        sys.stderr.write("Table or view name must be provided for column searches\n")
-        raise ValueError("Table or view name must be provided for column searches")
+        log_and_raise("Table or view name must be provided for column searches")
 
     # Get workspace name from environment variable
     workspace_name = get_workspace_name()
     
     # Search for the database entity
-    start_time = time.time()
+    start_time = time.perf_counter()
     search_results = await search_database_entity(entity_type, name, table_or_view)
-    end_time = time.time()
-    duration = end_time - start_time
-    log_timing(f"search_database_entity for {entity_type} '{name}'", duration)
+    if DEBUG_MODE:
+        log_timing(f"search_database_entity for {entity_type} '{name}'", time.perf_counter() - start_time)
 
     if not search_results:
         table_view_text = f" in {table_or_view}" if table_or_view else ""
@@ -59,33 +62,43 @@ async def handle_database_impact(arguments: dict | None) -> list[types.TextConte
             )
         ]
 
-    # Process each entity and get its impact
-    all_impacts = []
-    for entity in search_results[:5]:  # Limit to 5 to avoid excessive processing
+    async def process_entity(entity):
+        """Fetch and summarize the impact of a single entity, or return None on failure."""
         entity_id = entity.get("id")
         entity_name = entity.get("name")
         entity_schema = entity.get("schema", "Unknown")
 
         try:
-            start_time = time.time()
-            impact = get_impact(entity_id)
-            end_time = time.time()
-            duration = end_time - start_time
-            log_timing(f"get_impact for {entity_type} '{entity_name}'", duration)
-
+            start_time = time.perf_counter()
+            # get_impact is blocking; run it off the event loop so entities are fetched concurrently
+            impact_data = await asyncio.to_thread(get_impact, entity_id)
             if DEBUG_MODE:
-                write_json_to_file(os.path.join(LOGS_DIR, f"impact_data_{entity_type}_{entity_name}.json"), json.loads(impact))
-            impact_data = json.loads(impact)
-            impact_summary = process_database_entity_impact(
+                log_timing(f"get_impact for {entity_type} '{entity_name}'", time.perf_counter() - start_time)
+                write_json_to_file(IMPACT_JSON_PATH_TEMPLATE.format(entity_type, entity_name), impact_data)
+            return process_database_entity_impact(
                 impact_data, entity_type, entity_name, entity_schema
             )
-            all_impacts.append(impact_summary)
         except Exception as e:
-            sys.stderr.write(f"Error getting impact for {entity_type} '{entity_name}': {str(e)}\n")
+            logger.error("Error getting impact for %s '%s': %s", entity_type, entity_name, e)
+            return None
+
+    # The same id can appear more than once in the search results
+    distinct_results = []
+    seen_ids = set()
+    for entity in search_results:
+        entity_id = entity.get("id")
+        if entity_id in seen_ids:
+            continue
+        seen_ids.add(entity_id)
+        distinct_results.append(entity)
+
+    # Limit to 5 entities to avoid excessive processing; gather preserves the search result order
+    results = await asyncio.gather(*(process_entity(entity) for entity in distinct_results[:5]))
+    all_impacts = [impact_summary for impact_summary in results if impact_summary is not None]
 
     # Combine all impacts into a single report
     combined_report = generate_combined_database_report(
-        entity_type, name, table_or_view, search_results, all_impacts
+        entity_type, name, table_or_view, distinct_results, all_impacts
     )
 
     return [
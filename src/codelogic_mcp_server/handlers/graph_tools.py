@@ -11,11 +11,11 @@ Request bodies use **camelCase** keys aligned with CodeLogic JSON conventions.
 
 from __future__ import annotations
 
-import json
 import sys
 from typing import Any
 
 import mcp.types as types
+import orjson
 
 from ..graph_client import graph_error_message, graph_request
 from ..utils import get_mv_id
@@ -45,7 +45,7 @@ def _strip_nones(d: dict[str, Any]) -> dict[str, Any]:
 
 
 def _markdown_json(title: str, payload: Any) -> str:
-    text = json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True)
+    text = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
     return f"# {title}\n\n```json\n{text}\n```\n"
 
 
@@ -7,43 +7,30 @@
 Handler for the codelogic-method-impact tool.
 """
 
-import json
+import asyncio
+import logging
 import os
-import sys
 import time
+from collections import defaultdict
 import mcp.types as types
-from .common import get_workspace_name, write_json_to_file, log_timing, DEBUG_MODE, LOGS_DIR
-from ..utils import extract_nodes, extract_relationships, get_mv_id, get_method_nodes, get_impact, find_node_by_id, find_api_endpoints
+from .common import get_workspace_name, write_json_to_file, log_timing, log_and_raise, DEBUG_MODE, LOGS_DIR
+from ..utils import extract_nodes, extract_relationships, get_mv_id, get_method_nodes, get_impact, find_api_endpoints, METHOD_ENTITY_TYPES
 
+logger = logging.getLogger(__name__)
 
-async def handle_method_impact(arguments: dict | None) -> list[types.TextContent]:
-    """Handle the codelogic-method-impact tool for method/function analysis"""
-    if not arguments:
-        sys.stderr.write("Missing arguments\n")
-        raise ValueError("Missing arguments")
-
-    method_name = arguments.get("method")
-    class_name = arguments.get("class")
-    if class_name and "." in class_name:
-        class_name = class_name.split(".")[-1]
-
-    if not (method_name):
-        sys.stderr.write("Method must be provided\n")
-        raise ValueError("Method must be provided")
+# Upper bounds on the rows rendered in the node metrics and relationship tables,
+# so the report size stays bounded on very large impact graphs
+MAX_NODE_ROWS = int(os.getenv('CODELOGIC_MAX_NODE_ROWS', '100'))
+MAX_RELATIONSHIP_ROWS = int(os.getenv('CODELOGIC_MAX_RELATIONSHIP_ROWS', '200'))
+# Upper bound on the methods one codelogic-method-impact-batch call analyzes; each
+# one fans out into several concurrent CodeLogic requests
+MAX_BATCH_ITEMS = int(os.getenv('CODELOGIC_MAX_BATCH_ITEMS', '10'))
 
-    # Get workspace name from environment variable
-    workspace_name = get_workspace_name()
-    mv_id = get_mv_id(workspace_name)
-
-    start_time = time.time()
-    nodes, method_lookup_error = get_method_nodes(mv_id, method_name)
-    end_time = time.time()
-    duration = end_time - start_time
-    log_timing(f"get_method_nodes for method '{method_name}' in class '{class_name}'", duration)
-
-    if not nodes:
-        if method_lookup_error == "not_found":
-            error_message = f"""# Unable to Analyze Method: `{method_name}`
+# Reports returned when the method node lookup fails, keyed by the error kind
+# reported by get_method_nodes; any other failure uses METHOD_LOOKUP_FAILED_TEMPLATE.
+# Placeholders: {method}, {timeout} and {host}.
+METHOD_LOOKUP_ERROR_TEMPLATES = {
+    "not_found": """# Unable to Analyze Method: `{method}`
 
 ## Error
 No method nodes matched this short name in the current workspace materialized view (HTTP 404 NOT_FOUND from the CodeLogic search API).
@@ -52,19 +39,17 @@ No method nodes matched this short name in the current workspace materialized vi
 1. Confirm the method exists in the indexed codebase and spelling matches the symbol short name.
 2. Ensure `CODELOGIC_WORKSPACE_NAME` points at the workspace that contains this code.
 3. If the method was added recently, the view may need to be refreshed on the CodeLogic server.
-"""
-        elif method_lookup_error == "timeout":
-            error_message = f"""# Unable to Analyze Method: `{method_name}`
+""",
+    "timeout": """# Unable to Analyze Method: `{method}`
 
 ## Error
-The shortname search request timed out after {os.getenv('CODELOGIC_REQUEST_TIMEOUT', '120.0')}s (client timeout).
+The shortname search request timed out after {timeout}s (client timeout).
 
 ## Recommendations:
 1. Retry when the server is less busy, or raise `CODELOGIC_REQUEST_TIMEOUT` if appropriate.
-2. Verify network access to: {os.getenv('CODELOGIC_SERVER_HOST')}
-"""
-        elif method_lookup_error == "gateway_timeout":
-            error_message = f"""# Unable to Analyze Method: `{method_name}`
+2. Verify network access to: {host}
+""",
+    "gateway_timeout": """# Unable to Analyze Method: `{method}`
 
 ## Error
 The CodeLogic API returned **504 Gateway Timeout** while searching for method nodes (upstream did not respond in time).
@@ -72,10 +57,11 @@ The CodeLogic API returned **504 Gateway Timeout** while searching for method no
 ## Recommendations:
 1. Try again in a few minutes; transient load or cold queries often cause this.
 2. If Swagger returns 404 quickly for the same method and workspace, report the discrepancy to CodeLogic — the authenticated or MCP request path may differ from browser/Swagger.
-3. Server: {os.getenv('CODELOGIC_SERVER_HOST')}
-"""
-        else:
-            error_message = f"""# Unable to Analyze Method: `{method_name}`
+3. Server: {host}
+""",
+}
+
+METHOD_LOOKUP_FAILED_TEMPLATE = """# Unable to Analyze Method: `{method}`
 
 ## Error
 The request to retrieve method information from the CodeLogic server failed (timeout, HTTP error, or empty result).
@@ -88,8 +74,53 @@ The request to retrieve method information from the CodeLogic server failed (tim
 ## Recommendations:
 1. Check MCP stderr logs for the exact HTTP status and message
 2. Verify the method name and workspace configuration
-3. Server: {os.getenv('CODELOGIC_SERVER_HOST')}
+3. Server: {host}
+"""
+
+# Report for a codelogic-method-impact-batch item whose analysis raised.
+# Placeholders: {method} and {error}.
+METHOD_BATCH_ERROR_TEMPLATE = """# Unable to Analyze Method: `{method}`
+
+## Error
+```
+{error}
+```
 """
+
+
+async def handle_method_impact(arguments: dict | None) -> list[types.TextContent]:
+    """Handle the codelogic-method-impact tool for method/function analysis"""
+    if not arguments:
+        log_and_raise("Missing arguments")
+
+    method_name = arguments.get("method")
+    class_name = arguments.get("class")
+    if class_name and "." in class_name:
+        class_name = class_name.split(".")[-1]
+
+    if not (method_name):
+        log_and_raise("Method must be provided")
+
+    # Lowercased names are reused by every case-insensitive match below
+    method_name_lower = method_name.lower()
+    class_name_lower = class_name.lower() if class_name else None
+
+    # Get workspace name from environment variable
+    workspace_name = get_workspace_name()
+    # The CodeLogic API helpers are blocking; run them off the event loop
+    mv_id = await asyncio.to_thread(get_mv_id, workspace_name)
+
+    start_time = time.perf_counter()
+    nodes, method_lookup_error = await asyncio.to_thread(get_method_nodes, mv_id, method_name)
+    if DEBUG_MODE:
+        log_timing(f"get_method_nodes for method '{method_name}' in class '{class_name}'", time.perf_counter() - start_time)
+
+    if not nodes:
+        error_message = METHOD_LOOKUP_ERROR_TEMPLATES.get(method_lookup_error, METHOD_LOOKUP_FAILED_TEMPLATE).format(
+            method=method_name,
+            timeout=os.getenv('CODELOGIC_REQUEST_TIMEOUT', '120.0'),
+            host=os.getenv('CODELOGIC_SERVER_HOST'),
+        )
         return [
             types.TextContent(
                 type="text",
@@ -98,53 +129,69 @@ The request to retrieve method information from the CodeLogic server failed (tim
         ]
 
     if class_name:
-        node = next((n for n in nodes if f"|{class_name}|" in n['identity'] or f"|{class_name}.class|" in n['identity']), None)
+        # Build the identity tokens once rather than per candidate node
+        class_token = f"|{class_name}|"
+        class_file_token = f"|{class_name}.class|"
+        node = next((n for n in nodes if class_token in n['identity'] or class_file_token in n['identity']), None)
         if not node:
             raise ValueError(f"No matching class found for {class_name}")
     else:
         node = nodes[0]
 
-    start_time = time.time()
-    impact = get_impact(node['properties']['id'])
-    end_time = time.time()
-    duration = end_time - start_time
-    log_timing(f"get_impact for node '{node['name']}'", duration)
-    
+    start_time = time.perf_counter()
+    impact_data = await asyncio.to_thread(get_impact, node['properties']['id'])
+    if DEBUG_MODE:
+        log_timing(f"get_impact for node '{node['name']}'", time.perf_counter() - start_time)
+
     if DEBUG_MODE:
         method_file_name = os.path.join(LOGS_DIR, f"impact_data_method_{class_name}_{method_name}.json") if class_name else os.path.join(LOGS_DIR, f"impact_data_method_{method_name}.json")
-        write_json_to_file(method_file_name, json.loads(impact))
-    
-    impact_data = json.loads(impact)
+        write_json_to_file(method_file_name, impact_data)
+
     nodes = extract_nodes(impact_data)
     relationships = extract_relationships(impact_data)
 
-    # Better method to find the target method node with complexity information
-    target_node = None
-
-    # Support both Java and DotNet method entities
-    method_entity_types = ['JavaMethodEntity', 'DotNetMethodEntity']
+    # Bind the raw graph once and index nodes by id so relationship endpoints resolve in O(1)
+    data = impact_data.get('data') or {}
+    raw_nodes = data.get('nodes') or []
+    raw_rels = data.get('relationships') or []
+    node_by_id = {n['id']: n for n in raw_nodes}
+
+    # Better method to find the target method node with complexity information.
+    # A single pass collects method nodes of any supported language, the subset
+    # whose identity contains the class name, and the first of each that
+    # carries complexity metrics. It also remembers the class node, which is
+    # the fallback source of ownership information, and indexes application nodes.
     method_nodes = []
-
-    # First look for method nodes of any supported language
-    for entity_type in method_entity_types:
-        language_method_nodes = [n for n in nodes if n['primaryLabel'] == entity_type and method_name.lower() in n['name'].lower()]
-        method_nodes.extend(language_method_nodes)
-
-    # If we have class name, further filter to find nodes that contain it
-    if class_name:
-        class_filtered_nodes = [n for n in method_nodes if class_name.lower() in n['identity'].lower()]
-        if class_filtered_nodes:
-            method_nodes = class_filtered_nodes
-
-    # Find the node with complexity metrics (prefer this)
-    for n in method_nodes:
-        if n['properties'].get('statistics.cyclomaticComplexity') is not None:
-            target_node = n
-            break
-
-    # If not found, take the first method node
-    if not target_node and method_nodes:
-        target_node = method_nodes[0]
+    class_filtered_nodes = []
+    method_node_with_metrics = None
+    class_node_with_metrics = None
+    class_node = None
+    app_id_to_name = {}
+
+    for n in nodes:
+        if n['primaryLabel'] == 'Application':
+            app_id_to_name[n['id']] = n['name']
+        if class_name and class_node is None and n['primaryLabel'].endswith('ClassEntity') and class_name_lower in n['name'].lower():
+            class_node = n
+        if n['primaryLabel'] not in METHOD_ENTITY_TYPES or method_name_lower not in n['name'].lower():
+            continue
+        has_metrics = n['properties'].get('statistics.cyclomaticComplexity') is not None
+        method_nodes.append(n)
+        if has_metrics and method_node_with_metrics is None:
+            method_node_with_metrics = n
+        if class_name and class_name_lower in n['identity'].lower():
+            class_filtered_nodes.append(n)
+            if has_metrics and class_node_with_metrics is None:
+                class_node_with_metrics = n
+
+    # Prefer nodes matching the class, and within those the node with complexity
+    # metrics; otherwise take the first candidate
+    if class_filtered_nodes:
+        target_node = class_node_with_metrics or class_filtered_nodes[0]
+    elif method_nodes:
+        target_node = method_node_with_metrics or method_nodes[0]
+    else:
+        target_node = None
 
     # Last resort: fall back to the original node (which might not have metrics)
     if not target_node:
@@ -159,78 +206,78 @@ The request to retrieve method information from the CodeLogic server failed (tim
     code_reviewers = target_node['properties'].get('codelogic.reviewers', []) if target_node else []
 
     # If target node doesn't have owners/reviewers, try to find them from the class or file node
-    if not code_owners or not code_reviewers:
-        class_node = None
-        if class_name:
-            class_node = next((n for n in nodes if n['primaryLabel'].endswith('ClassEntity') and class_name.lower() in n['name'].lower()), None)
-
-        if class_node:
-            if not code_owners:
-                code_owners = class_node['properties'].get('codelogic.owners', [])
-            if not code_reviewers:
-                code_reviewers = class_node['properties'].get('codelogic.reviewers', [])
-
-    # Identify dependents (systems that depend on this method)
+    if (not code_owners or not code_reviewers) and class_node:
+        if not code_owners:
+            code_owners = class_node['properties'].get('codelogic.owners', [])
+        if not code_reviewers:
+            code_reviewers = class_node['properties'].get('codelogic.reviewers', [])
+
+    # Every application found in the impact analysis is potentially affected.
+    # A node's groupIds can only name one of these applications, so mapping
+    # nodes through groupIds would add nothing further.
+    affected_applications = set(app_id_to_name.values())
+
+    # Walk the relationships once, collecting dependents (systems that depend on
+    # this method), application dependencies, and rows for the relationship table.
+    # The graph can repeat a relationship (e.g. reflected across applications), so
+    # each (type, startId, endId) triple is only processed once.
     dependents = []
+    app_dependencies = defaultdict(list)
+    relationship_rows = []
+    seen_rels = set()
+    target_id = node['properties'].get('id')
+
+    for rel in raw_rels:
+        rel_key = (rel.get('type'), rel['startId'], rel['endId'])
+        if rel_key in seen_rels:
+            continue
+        seen_rels.add(rel_key)
 
-    for rel in impact_data.get('data', {}).get('relationships', []):
-        start_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel['startId'])
-        end_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel['endId'])
+        start_node = node_by_id.get(rel['startId'])
+        end_node = node_by_id.get(rel['endId'])
+        rel_type = rel.get('type')
 
-        if start_node and end_node and end_node['id'] == node['properties'].get('id'):
+        if start_node and end_node and end_node['id'] == target_id:
             # This is an incoming relationship (dependent)
             dependents.append({
                 "name": start_node.get('name'),
                 "type": start_node.get('primaryLabel'),
-                "relationship": rel.get('type')
+                "relationship": rel_type
             })
 
-    # Identify applications that depend on this method
-    affected_applications = set()
-    app_nodes = [n for n in nodes if n['primaryLabel'] == 'Application']
-    app_id_to_name = {app['id']: app['name'] for app in app_nodes}
-
-    # Add all applications found in the impact analysis as potentially affected
-    for app in app_nodes:
-        affected_applications.add(app['name'])
+        # For GROUPS relationships - application groups a component
+        if rel_type == 'GROUPS' and start_node and start_node.get('primaryLabel') == 'Application':
+            app_name = start_node.get('name')
+            affected_applications.add(app_name)
 
-    # Map nodes to their applications via groupIds (Java approach)
-    for node_item in nodes:
-        if 'groupIds' in node_item['properties']:
-            for group_id in node_item['properties']['groupIds']:
-                if group_id in app_id_to_name:
-                    affected_applications.add(app_id_to_name[group_id])
-
-    # Count direct and indirect application dependencies
-    app_dependencies = {}
-
-    # Check both REFERENCES_GROUP and GROUPS relationships
-    for rel in impact_data.get('data', {}).get('relationships', []):
-        if rel.get('type') in ['REFERENCES_GROUP', 'GROUPS']:
-            start_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel['startId'])
-            end_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel['endId'])
-
-            # For GROUPS relationships - application groups a component
-            if rel.get('type') == 'GROUPS' and start_node and start_node.get('primaryLabel') == 'Application':
-                app_name = start_node.get('name')
+        # For REFERENCES_GROUP - one application depends on another
+        if rel_type == 'REFERENCES_GROUP' and start_node and end_node and start_node.get('primaryLabel') == 'Application' and end_node.get('primaryLabel') == 'Application':
+            app_name = start_node.get('name')
+            depends_on = end_node.get('name')
+            if app_name:
                 affected_applications.add(app_name)
+                app_dependencies[app_name].append(depends_on)
 
-            # For REFERENCES_GROUP - one application depends on another
-            if rel.get('type') == 'REFERENCES_GROUP' and start_node and end_node and start_node.get('primaryLabel') == 'Application' and end_node.get('primaryLabel') == 'Application':
-                app_name = start_node.get('name')
-                depends_on = end_node.get('name')
-                if app_name:
-                    affected_applications.add(app_name)
-                    if app_name not in app_dependencies:
-                        app_dependencies[app_name] = []
-                    app_dependencies[app_name].append(depends_on)
+        if start_node and end_node:
+            relationship_rows.append({
+                "type": rel.get('type', 'UNKNOWN'),
+                "source": start_node.get('name', 'Unknown'),
+                "source_type": start_node.get('primaryLabel', 'Unknown'),
+                "target": end_node.get('name', 'Unknown'),
+                "target_type": end_node.get('primaryLabel', 'Unknown'),
+                "source_lower": start_node.get('name', 'Unknown').lower(),
+                "target_lower": end_node.get('name', 'Unknown').lower()
+            })
+
+    # Sort the affected applications once; both report sections list them in this order
+    sorted_apps = sorted(affected_applications)
 
     # Use the new utility function to detect API endpoints and controllers
-    endpoint_nodes, rest_endpoints, api_controllers, endpoint_dependencies = find_api_endpoints(nodes, impact_data.get('data', {}).get('relationships', []))
+    endpoint_nodes, rest_endpoints, api_controllers, endpoint_dependencies = find_api_endpoints(nodes, raw_rels, node_by_id)
 
-    # Format nodes with metrics in markdown table format
-    nodes_table = "| Name | Type | Complexity | Instruction Count | Method Count | Outgoing Refs | Incoming Refs |\n"
-    nodes_table += "|------|------|------------|-------------------|-------------|---------------|---------------|\n"
+    # Format nodes with metrics in markdown table format. Each row is paired with
+    # its complexity so the table can keep the riskiest nodes when it is capped.
+    node_rows = []
 
     for node_item in nodes:
         name = node_item['name']
@@ -241,28 +288,26 @@ The request to retrieve method information from the CodeLogic server failed (tim
         outgoing_refs = node_item['properties'].get('statistics.outgoingExternalReferenceTotal', 'N/A')
         incoming_refs = node_item['properties'].get('statistics.incomingExternalReferenceTotal', 'N/A')
 
-        # Mark high complexity items
-        complexity_str = str(node_complexity)
-        if node_complexity not in ('N/A', None) and float(node_complexity) > 10:
-            complexity_str = f"**{complexity_str}** ⚠️"
+        # Mark high complexity items (the metric is numeric when present)
+        if isinstance(node_complexity, (int, float)) and node_complexity > 10:
+            complexity_str = f"**{node_complexity}** ⚠️"
+        else:
+            complexity_str = str(node_complexity)
 
-        nodes_table += f"| {name} | {node_type} | {complexity_str} | {node_instructions} | {node_methods} | {outgoing_refs} | {incoming_refs} |\n"
+        score = node_complexity if isinstance(node_complexity, (int, float)) else 0
+        node_rows.append((score, f"| {name} | {node_type} | {complexity_str} | {node_instructions} | {node_methods} | {outgoing_refs} | {incoming_refs} |"))
 
-    # Format relationships in a more structured way for table display
-    relationship_rows = []
+    omitted_nodes = len(node_rows) - MAX_NODE_ROWS
+    if omitted_nodes > 0:
+        node_rows = sorted(node_rows, key=lambda row: row[0], reverse=True)[:MAX_NODE_ROWS]
 
-    for rel in impact_data.get('data', {}).get('relationships', []):
-        start_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel['startId'])
-        end_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel['endId'])
-
-        if start_node and end_node:
-            relationship_rows.append({
-                "type": rel.get('type', 'UNKNOWN'),
-                "source": start_node.get('name', 'Unknown'),
-                "source_type": start_node.get('primaryLabel', 'Unknown'),
-                "target": end_node.get('name', 'Unknown'),
-                "target_type": end_node.get('primaryLabel', 'Unknown')
-            })
+    nodes_table = "\n".join([
+        "| Name | Type | Complexity | Instruction Count | Method Count | Outgoing Refs | Incoming Refs |",
+        "|------|------|------------|-------------------|-------------|---------------|---------------|",
+        *(row for _, row in node_rows),
+    ]) + "\n"
+    if omitted_nodes > 0:
+        nodes_table += f"\n... ({omitted_nodes} more nodes omitted)\n"
 
     # Also keep the relationships grouped by type for reference
     relationships_by_type = {}
@@ -276,7 +321,7 @@ The request to retrieve method information from the CodeLogic server failed (tim
             relationships_by_type[rel_type].append(source)
 
     # Build the markdown output
-    impact_description = f"""# Impact Analysis for Method: `{method_name}`
+    parts = [f"""# Impact Analysis for Method: `{method_name}`
 
 ## Guidelines for AI
 - Pay special attention to methods with Cyclomatic Complexity over 10 as they represent higher risk
@@ -289,70 +334,70 @@ The request to retrieve method information from the CodeLogic server failed (tim
 ## Summary
 - **Method**: `{method_name}`
 - **Class**: `{class_name or 'N/A'}`
-"""
+"""]
 
     # Add code ownership information if available
     if code_owners:
-        impact_description += f"- **Code Owners**: {', '.join(code_owners)}\n"
+        parts.append(f"- **Code Owners**: {', '.join(code_owners)}\n")
     if code_reviewers:
-        impact_description += f"- **Code Reviewers**: {', '.join(code_reviewers)}\n"
+        parts.append(f"- **Code Reviewers**: {', '.join(code_reviewers)}\n")
 
-    impact_description += f"- **Complexity**: {complexity}\n"
-    impact_description += f"- **Instruction Count**: {instruction_count}\n"
-    impact_description += f"- **Affected Applications**: {len(affected_applications)}\n"
+    parts.append(f"- **Complexity**: {complexity}\n")
+    parts.append(f"- **Instruction Count**: {instruction_count}\n")
+    parts.append(f"- **Affected Applications**: {len(affected_applications)}\n")
 
     # Add affected REST endpoints to the Summary section
     if endpoint_nodes:
-        impact_description += "\n### Affected REST Endpoints\n"
+        parts.append("\n### Affected REST Endpoints\n")
         for endpoint in endpoint_nodes:
-            impact_description += f"- `{endpoint['http_verb']} {endpoint['path']}`\n"
+            parts.append(f"- `{endpoint['http_verb']} {endpoint['path']}`\n")
 
     # Start the Risk Assessment section
-    impact_description += "\n## Risk Assessment\n"
+    parts.append("\n## Risk Assessment\n")
 
     # Add complexity risk assessment
     if complexity not in ('N/A', None) and float(complexity) > 10:
-        impact_description += f"⚠️ **Warning**: Cyclomatic complexity of {complexity} exceeds threshold of 10\n\n"
+        parts.append(f"⚠️ **Warning**: Cyclomatic complexity of {complexity} exceeds threshold of 10\n\n")
     else:
-        impact_description += "✅ Complexity is within acceptable limits\n\n"
+        parts.append("✅ Complexity is within acceptable limits\n\n")
 
     # Add cross-application risk assessment
     if len(affected_applications) > 1:
-        impact_description += f"⚠️ **Cross-Application Dependency**: This method is used by {len(affected_applications)} applications:\n"
-        for app in sorted(affected_applications):
+        parts.append(f"⚠️ **Cross-Application Dependency**: This method is used by {len(affected_applications)} applications:\n")
+        for app in sorted_apps:
             deps = app_dependencies.get(app, [])
             if deps:
-                impact_description += f"- `{app}` (depends on: {', '.join([f'`{d}`' for d in deps])})\n"
+                parts.append(f"- `{app}` (depends on: {', '.join([f'`{d}`' for d in deps])})\n")
             else:
-                impact_description += f"- `{app}`\n"
-        impact_description += "\nChanges to this method may cause widespread impacts across multiple applications. Consider careful testing across all affected systems.\n"
+                parts.append(f"- `{app}`\n")
+        parts.append("\nChanges to this method may cause widespread impacts across multiple applications. Consider careful testing across all affected systems.\n")
     else:
-        impact_description += "✅ Method is used within a single application context\n"
+        parts.append("✅ Method is used within a single application context\n")
 
     # Add REST API risk assessment (now as a subsection of Risk Assessment)
     if rest_endpoints or api_controllers or endpoint_nodes:
-        impact_description += "\n### REST API Risk Assessment\n"
-        impact_description += "⚠️ **API Impact Alert**: This method affects REST endpoints or API controllers\n"
+        parts.append("\n### REST API Risk Assessment\n")
+        parts.append("⚠️ **API Impact Alert**: This method affects REST endpoints or API controllers\n")
 
         if rest_endpoints:
-            impact_description += "\n#### REST Methods with Annotations\n"
+            parts.append("\n#### REST Methods with Annotations\n")
             for endpoint in rest_endpoints:
-                impact_description += f"- `{endpoint['name']}` ({endpoint['annotation']})\n"
+                parts.append(f"- `{endpoint['name']}` ({endpoint['annotation']})\n")
 
         if api_controllers:
-            impact_description += "\n#### Affected API Controllers\n"
+            parts.append("\n#### Affected API Controllers\n")
             for controller in api_controllers:
-                impact_description += f"- `{controller['name']}` ({controller['type']})\n"
+                parts.append(f"- `{controller['name']}` ({controller['type']})\n")
 
         # Add endpoint dependencies as a subsection of Risk Assessment
         if endpoint_dependencies:
-            impact_description += "\n### REST API Dependencies\n"
-            impact_description += "⚠️ **Chained API Risk**: Changes may affect multiple interconnected endpoints\n\n"
+            parts.append("\n### REST API Dependencies\n")
+            parts.append("⚠️ **Chained API Risk**: Changes may affect multiple interconnected endpoints\n\n")
             for dep in endpoint_dependencies:
-                impact_description += f"- `{dep['source']}` depends on `{dep['target']}`\n"
+                parts.append(f"- `{dep['source']}` depends on `{dep['target']}`\n")
 
         # Add API Change Risk Factors as a subsection of Risk Assessment
-        impact_description += """
+        parts.append("""
 ### API Change Risk Factors
 - Changes may affect external consumers and services
 - Consider versioning strategy for breaking changes
@@ -361,63 +406,75 @@ The request to retrieve method information from the CodeLogic server failed (tim
 - Consider backward compatibility requirements
 - **Chained API calls**: Changes may have cascading effects across multiple endpoints
 - **Cross-application impact**: API changes could affect dependent systems
-"""
+""")
     else:
-        impact_description += "\n### REST API Risk Assessment\n"
-        impact_description += "✅ No direct impact on REST endpoints or API controllers detected\n"
+        parts.append("\n### REST API Risk Assessment\n")
+        parts.append("✅ No direct impact on REST endpoints or API controllers detected\n")
 
     # Ownership-based consultation recommendation
     if code_owners or code_reviewers:
-        impact_description += "\n### Code Ownership\n"
+        parts.append("\n### Code Ownership\n")
         if code_owners:
-            impact_description += f"👤 **Code Owners**: Changes to this code should be reviewed by: {', '.join(code_owners)}\n"
+            parts.append(f"👤 **Code Owners**: Changes to this code should be reviewed by: {', '.join(code_owners)}\n")
         if code_reviewers:
-            impact_description += f"👁️ **Preferred Reviewers**: Consider getting reviews from: {', '.join(code_reviewers)}\n"
+            parts.append(f"👁️ **Preferred Reviewers**: Consider getting reviews from: {', '.join(code_reviewers)}\n")
 
         if code_owners:
-            impact_description += "\nConsult with the code owners before making significant changes to ensure alignment with original design intent.\n"
+            parts.append("\nConsult with the code owners before making significant changes to ensure alignment with original design intent.\n")
 
-    impact_description += f"""
+    parts.append(f"""
 ## Method Impact
 This analysis focuses on systems that depend on `{method_name}`. Modifying this method could affect these dependents:
 
-"""
+""")
 
     if dependents:
         for dep in dependents:
-            impact_description += f"- `{dep['name']}` ({dep['type']}) via `{dep['relationship']}`\n"
+            parts.append(f"- `{dep['name']}` ({dep['type']}) via `{dep['relationship']}`\n")
     else:
-        impact_description += "No components directly depend on this method. The change appears to be isolated.\n"
+        parts.append("No components directly depend on this method. The change appears to be isolated.\n")
 
-    impact_description += f"\n## Detailed Node Metrics\n{nodes_table}\n"
+    parts.append(f"\n## Detailed Node Metrics\n{nodes_table}\n")
 
-    # Create relationship table
-    relationship_table = "| Relationship Type | Source | Source Type | Target | Target Type |\n"
-    relationship_table += "|------------------|--------|-------------|--------|------------|\n"
+    # Create relationship table; when it is capped, relationships touching the
+    # analyzed method are kept ahead of the rest
+    relationship_table_rows = []
 
     for row in relationship_rows:
         # Highlight relationships involving our target method
         highlight = ""
-        if (method_name.lower() in row["source"].lower() or method_name.lower() in row["target"].lower()):
-            if class_name and (class_name.lower() in row["source"].lower() or class_name.lower() in row["target"].lower()):
+        if method_name_lower in row["source_lower"] or method_name_lower in row["target_lower"]:
+            if class_name and (class_name_lower in row["source_lower"] or class_name_lower in row["target_lower"]):
                 highlight = "**"  # Bold the important relationships
 
-        relationship_table += f"| {highlight}{row['type']}{highlight} | {highlight}{row['source']}{highlight} | {row['source_type']} | {highlight}{row['target']}{highlight} | {row['target_type']} |\n"
+        relationship_table_rows.append((bool(highlight), f"| {highlight}{row['type']}{highlight} | {highlight}{row['source']}{highlight} | {row['source_type']} | {highlight}{row['target']}{highlight} | {row['target_type']} |"))
 
-    impact_description += "\n## Relationship Map\n"
-    impact_description += relationship_table
+    omitted_relationships = len(relationship_table_rows) - MAX_RELATIONSHIP_ROWS
+    if omitted_relationships > 0:
+        relationship_table_rows = sorted(relationship_table_rows, key=lambda row: row[0], reverse=True)[:MAX_RELATIONSHIP_ROWS]
+
+    parts.append("\n## Relationship Map\n")
+    parts.append("\n".join([
+        "| Relationship Type | Source | Source Type | Target | Target Type |",
+        "|------------------|--------|-------------|--------|------------|",
+        *(row for _, row in relationship_table_rows),
+    ]) + "\n")
+    if omitted_relationships > 0:
+        parts.append(f"\n... ({omitted_relationships} more relationships omitted)\n")
 
     # Add application dependency visualization if multiple applications are affected
     if len(affected_applications) > 1:
-        impact_description += "\n## Application Dependency Graph\n"
-        impact_description += "```\n"
-        for app in sorted(affected_applications):
+        parts.append("\n## Application Dependency Graph\n")
+        parts.append("```\n")
+        for app in sorted_apps:
             deps = app_dependencies.get(app, [])
             if deps:
-                impact_description += f"{app} → {' → '.join(deps)}\n"
+                parts.append(f"{app} → {' → '.join(deps)}\n")
             else:
-                impact_description += f"{app} (no dependencies)\n"
-        impact_description += "```\n"
+                parts.append(f"{app} (no dependencies)\n")
+        parts.append("```\n")
+
+    impact_description = "".join(parts)
 
     return [
         types.TextContent(
@@ -425,3 +482,36 @@ This analysis focuses on systems that depend on `{method_name}`. Modifying this
             text=impact_description,
         )
     ]
+
+
+async def handle_method_impact_batch(arguments: dict | None) -> list[types.TextContent]:
+    """Handle the codelogic-method-impact-batch tool by analyzing several methods concurrently"""
+    if not arguments or not arguments.get("items"):
+        log_and_raise("Items must be provided")
+
+    # Analyze each distinct method/class pair once, in the order first requested
+    pairs = list(dict.fromkeys((item.get("method"), item.get("class")) for item in arguments["items"]))
+    if len(pairs) > MAX_BATCH_ITEMS:
+        log_and_raise(f"Too many methods: {len(pairs)}. At most {MAX_BATCH_ITEMS} can be analyzed per batch")
+
+    # Each analysis runs its CodeLogic lookups in worker threads, so gathering overlaps the HTTP waits
+    results = await asyncio.gather(
+        *(handle_method_impact({"method": method, "class": class_name}) for method, class_name in pairs),
+        return_exceptions=True,
+    )
+
+    reports = []
+    for (method, _), result in zip(pairs, results):
+        # gather returns CancelledError, which is not an Exception, for cancelled items
+        if isinstance(result, BaseException):
+            logger.error("Error analyzing method %s: %s", method, result)
+            reports.append(METHOD_BATCH_ERROR_TEMPLATE.format(method=method, error=result))
+        else:
+            reports.append("".join(content.text for content in result))
+
+    return [
+        types.TextContent(
+            type="text",
+            text="\n---\n\n".join(reports),
+        )
+    ]
@@ -14,12 +14,15 @@ impact analysis.
 
 import os
 import sys
+import threading
 import httpx
-import json
+import orjson
 import toml
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 import urllib.parse
+from collections import OrderedDict
+from functools import lru_cache
 
 def get_package_version() -> str:
     """
@@ -50,6 +53,13 @@ def get_package_version() -> str:
 TOKEN_CACHE_TTL = int(os.getenv('CODELOGIC_TOKEN_CACHE_TTL', '3600'))  # Default 1 hour
 METHOD_CACHE_TTL = int(os.getenv('CODELOGIC_METHOD_CACHE_TTL', '300'))  # Default 5 minutes
 IMPACT_CACHE_TTL = int(os.getenv('CODELOGIC_IMPACT_CACHE_TTL', '300'))  # Default 5 minutes
+MV_ID_CACHE_TTL = int(os.getenv('CODELOGIC_MV_ID_CACHE_TTL', '300'))  # Default 5 minutes
+
+# Impact payloads can be several MB each, so bound how many are kept in memory
+IMPACT_CACHE_MAX_ENTRIES = int(os.getenv('CODELOGIC_IMPACT_CACHE_MAX_ENTRIES', '256'))
+
+# Bypass the materialized view, method node and impact caches (useful when debugging stale results)
+CACHE_DISABLED = os.getenv('CODELOGIC_CACHE_DISABLED', 'false').lower() == 'true'
 
 # Timeout settings from environment variables (in seconds)
 REQUEST_TIMEOUT = float(os.getenv('CODELOGIC_REQUEST_TIMEOUT', '120.0'))
@@ -59,7 +69,10 @@ CONNECT_TIMEOUT = float(os.getenv('CODELOGIC_CONNECT_TIMEOUT', '30.0'))
 _cached_token = None
 _token_expiry = None
 _method_nodes_cache: Dict[str, tuple[List[Any], datetime]] = {}
-_impact_cache: Dict[str, tuple[str, datetime]] = {}
+# Least recently used first; get_impact runs in to_thread workers, so guard it with the lock
+_impact_cache: OrderedDict[str, tuple[Dict[str, Any], datetime]] = OrderedDict()
+_impact_cache_lock = threading.Lock()
+_mv_id_cache: Dict[str, tuple[str, datetime]] = {}
 
 # Configure HTTP client with improved settings
 _client = httpx.Client(
@@ -68,6 +81,33 @@ _client = httpx.Client(
     transport=httpx.HTTPTransport(retries=3)
 )
 
+# Lowercase annotation fragments that mark a method as a REST endpoint, and the
+# substrings used to pick the routing annotations out for display
+REST_MARKERS = (
+    'getmapping', 'postmapping', 'putmapping', 'deletemapping',
+    'requestmapping', 'httpget', 'httppost', 'httpput', 'httpdelete'
+)
+REST_MARKER_SUBSTR = ('mapping', 'http')
+
+# Node labels treated as methods in impact graphs
+METHOD_ENTITY_TYPES = frozenset({'JavaMethodEntity', 'DotNetMethodEntity'})
+
+# Database node labels: entities that can reference one another, and the
+# containers an entity can be nested in
+DATABASE_ENTITY_LABELS = frozenset({'Table', 'Column', 'View'})
+DATABASE_CONTAINER_LABELS = frozenset({'Table', 'Schema', 'Database'})
+
+# Relationship types checked for every relationship in an impact graph
+ENDPOINT_RELATIONSHIP_TYPES = frozenset({'INVOKES_ENDPOINT', 'REFERENCES_ENDPOINT'})
+CODE_ACCESS_RELATIONSHIP_TYPES = frozenset({
+    'REFERENCES', 'USES', 'SELECTS', 'UPDATES', 'INSERTS', 'DELETES', 'REFERENCES_TABLE'
+})
+DATABASE_REFERENCE_RELATIONSHIP_TYPES = frozenset({'REFERENCES', 'FOREIGN_KEY'})
+TABLE_REFERENCE_RELATIONSHIP_TYPES = frozenset({'REFERENCES', 'REFERENCES_TABLE'})
+
+# Substrings of a lowercased primaryLabel that mark an API controller node
+CONTROLLER_LABEL_TERMS = ('controller', 'restendpoint', 'apiendpoint', 'webservice')
+
 # Encode the workspace name to ensure it is safe for use in API calls
 encoded_workspace_name = urllib.parse.quote(os.getenv("CODELOGIC_WORKSPACE_NAME") or "")
 
@@ -91,11 +131,12 @@ def find_node_by_id(nodes, id):
 
 def get_mv_id(mv_name):
     """
-    Get materialized view ID using its name.
+    Get materialized view ID using its name, with caching.
 
     This is a helper function that combines authentication, getting the
     materialized view definition ID by name, and then retrieving the actual
-    materialized view ID from the definition.
+    materialized view ID from the definition. Results are cached since the
+    workspace name rarely changes during the lifetime of the process.
 
     Args:
         mv_name (str): The name of the materialized view
@@ -106,9 +147,26 @@ def get_mv_id(mv_name):
     Raises:
         httpx.HTTPError: If API requests fail
     """
+    now = datetime.now()
+
+    # Check cache
+    if not CACHE_DISABLED and mv_name in _mv_id_cache:
+        mv_id, expiry = _mv_id_cache[mv_name]
+        if now < expiry:
+            sys.stderr.write(f"Materialized view id cache hit for {mv_name}\n")
+            return mv_id
+        else:
+            sys.stderr.write(f"Materialized view id cache expired for {mv_name}\n")
+
     token = authenticate()
     mv_def_id = get_mv_definition_id(mv_name, token)
-    return get_mv_id_from_def(mv_def_id, token)
+    mv_id = get_mv_id_from_def(mv_def_id, token)
+
+    # Cache result
+    if not CACHE_DISABLED:
+        _mv_id_cache[mv_name] = (mv_id, now + timedelta(seconds=MV_ID_CACHE_TTL))
+        sys.stderr.write(f"Materialized view id cached for {mv_name} with TTL {MV_ID_CACHE_TTL}s\n")
+    return mv_id
 
 
 def get_mv_definition_id(mv_name, token):
@@ -181,7 +239,7 @@ def get_method_nodes(materialized_view_id, short_name):
     now = datetime.now()
 
     # Check cache
-    if cache_key in _method_nodes_cache:
+    if not CACHE_DISABLED and cache_key in _method_nodes_cache:
         nodes, expiry = _method_nodes_cache[cache_key]
         if now < expiry:
             sys.stderr.write(f"Method nodes cache hit for {short_name}\n")
@@ -223,8 +281,9 @@ def get_method_nodes(materialized_view_id, short_name):
 
         # Cache result
         nodes = response.json()['data']
-        _method_nodes_cache[cache_key] = (nodes, now + timedelta(seconds=METHOD_CACHE_TTL))
-        sys.stderr.write(f"Method nodes cached for {short_name} with TTL {METHOD_CACHE_TTL}s\n")
+        if not CACHE_DISABLED:
+            _method_nodes_cache[cache_key] = (nodes, now + timedelta(seconds=METHOD_CACHE_TTL))
+            sys.stderr.write(f"Method nodes cached for {short_name} with TTL {METHOD_CACHE_TTL}s\n")
         return nodes, None
     except httpx.TimeoutException as e:
         sys.stderr.write(f"Timeout error fetching method nodes for {short_name}: {e}\n")
@@ -251,9 +310,10 @@ def extract_relationships(impact_data):
         List[str]: List of formatted relationship strings
     """
     relationships = []
+    node_by_id = {node['id']: node for node in impact_data['data']['nodes']}
     for rel in impact_data['data']['relationships']:
-        start_node = find_node_by_id(impact_data['data']['nodes'], rel['startId'])
-        end_node = find_node_by_id(impact_data['data']['nodes'], rel['endId'])
+        start_node = node_by_id.get(rel['startId'])
+        end_node = node_by_id.get(rel['endId'])
         if start_node and end_node:
             relationship = f"- {start_node['identity']} ({rel['type']}) -> {end_node['identity']}"
             relationships.append(relationship)
@@ -271,7 +331,8 @@ def get_impact(id):
         id (str): The ID of the node for which to get impact analysis
 
     Returns:
-        str: JSON string with impact analysis data
+        dict: Parsed impact analysis data. Cached results are shared between
+        callers, so treat the returned dict as read-only.
 
     Raises:
         httpx.HTTPError: If API request fails
@@ -279,8 +340,15 @@ def get_impact(id):
     now = datetime.now()
 
     # Check cache
-    if id in _impact_cache:
-        impact, expiry = _impact_cache[id]
+    cached = None
+    if not CACHE_DISABLED:
+        with _impact_cache_lock:
+            cached = _impact_cache.get(id)
+            if cached is not None and now < cached[1]:
+                # Move the entry to the end so the least recently used entry is evicted first
+                _impact_cache.move_to_end(id)
+    if cached is not None:
+        impact, expiry = cached
         if now < expiry:
             sys.stderr.write(f"Impact cache hit for {id}\n")
             return impact
@@ -299,8 +367,13 @@ def get_impact(id):
     result = strip_unused_properties(response)
 
     # Cache result
-    _impact_cache[id] = (result, now + timedelta(seconds=IMPACT_CACHE_TTL))
-    sys.stderr.write(f"Impact cached for {id} with TTL {IMPACT_CACHE_TTL}s\n")
+    if not CACHE_DISABLED:
+        with _impact_cache_lock:
+            _impact_cache[id] = (result, now + timedelta(seconds=IMPACT_CACHE_TTL))
+            _impact_cache.move_to_end(id)
+            while len(_impact_cache) > IMPACT_CACHE_MAX_ENTRIES:
+                _impact_cache.popitem(last=False)
+        sys.stderr.write(f"Impact cached for {id} with TTL {IMPACT_CACHE_TTL}s\n")
     return result
 
 
@@ -315,9 +388,9 @@ def strip_unused_properties(response):
         response (httpx.Response): API response with impact analysis data
 
     Returns:
-        str: Cleaned JSON string with optimized data
+        dict: Parsed impact analysis data with the unused properties removed
     """
-    data = json.loads(response.text)
+    data = orjson.loads(response.text)
 
     # Strip out specific fields
     for node in data.get('data', {}).get('nodes', []):
@@ -336,7 +409,7 @@ def strip_unused_properties(response):
         properties.pop('identity', None)
         properties.pop('name', None)
 
-    return json.dumps(data)
+    return data
 
 
 def extract_nodes(impact_data):
@@ -484,6 +557,8 @@ def process_database_entity_impact(impact_data, entity_type, entity_name, entity
     """
     nodes = extract_nodes(impact_data)
     relationships = extract_relationships(impact_data)
+    # Index raw nodes once; the helpers below resolve relationship endpoints through it
+    node_by_id = {n['id']: n for n in impact_data.get('data', {}).get('nodes', [])}
 
     # Find the target entity node
     target_node = next((n for n in nodes if n['name'] == entity_name and n['primaryLabel'] == entity_type_to_label(entity_type)), None)
@@ -505,15 +580,15 @@ def process_database_entity_impact(impact_data, entity_type, entity_name, entity
     # Get the parent table for columns
     parent_table = None
     if entity_type == "column":
-        parent_table = find_parent_table(target_node['id'], impact_data)
+        parent_table = find_parent_table(target_node['id'], impact_data, node_by_id)
 
     # Find code dependencies
-    direct_dependent_code = find_direct_dependent_code(target_node['id'], impact_data)
+    direct_dependent_code = find_direct_dependent_code(target_node['id'], impact_data, node_by_id)
 
     # For columns, also include code that references the containing table
     table_dependent_code = []
     if entity_type == "column" and parent_table:
-        table_dependent_code = find_direct_dependent_code(parent_table['id'], impact_data)
+        table_dependent_code = find_direct_dependent_code(parent_table['id'], impact_data, node_by_id)
         # Mark these as indirect references
         for item in table_dependent_code:
             item["relationship_type"] = "indirect (via table)"
@@ -527,13 +602,13 @@ def process_database_entity_impact(impact_data, entity_type, entity_name, entity
             seen_ids.add(item["id"])
 
     # Find related database objects
-    referencing_tables = find_referencing_database_objects(target_node['id'], impact_data)
+    referencing_tables = find_referencing_database_objects(target_node['id'], impact_data, node_by_id)
 
     # Determine affected applications
     dependent_applications = extract_dependent_applications(dependent_code, impact_data)
 
     # Also include applications that directly group the database objects
-    db_applications = find_database_applications(target_node['id'], impact_data)
+    db_applications = find_database_applications(target_node['id'], impact_data, node_by_id)
     for app in db_applications:
         if app not in dependent_applications:
             dependent_applications.append(app)
@@ -547,7 +622,7 @@ def process_database_entity_impact(impact_data, entity_type, entity_name, entity
     # Check code entities that reference this database entity
     for code_item in dependent_code:
         code_id = code_item.get("id")
-        code_node = next((n for n in nodes if n['id'] == code_id), None)
+        code_node = node_by_id.get(code_id)
         if code_node:
             owners = code_node.get('properties', {}).get('codelogic.owners', [])
             reviewers = code_node.get('properties', {}).get('codelogic.reviewers', [])
@@ -558,7 +633,7 @@ def process_database_entity_impact(impact_data, entity_type, entity_name, entity
             for rel in impact_data.get('data', {}).get('relationships', []):
                 if rel.get('type').startswith('CONTAINS_') and rel.get('endId') == code_id:
                     parent_id = rel.get('startId')
-                    parent_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), parent_id)
+                    parent_node = node_by_id.get(parent_id)
                     if parent_node and parent_node.get('primaryLabel', '').endswith('ClassEntity'):
                         parent_owners = parent_node.get('properties', {}).get('codelogic.owners', [])
                         parent_reviewers = parent_node.get('properties', {}).get('codelogic.reviewers', [])
@@ -602,24 +677,28 @@ def extract_schema_name(node, nodes):
     return None
 
 
-def find_parent_table(column_id, impact_data):
+def find_parent_table(column_id, impact_data, node_by_id=None):
     """Find the table that contains a column"""
+    if node_by_id is None:
+        node_by_id = {n['id']: n for n in impact_data.get('data', {}).get('nodes', [])}
     for rel in impact_data.get('data', {}).get('relationships', []):
         if rel.get('type') == 'CONTAINS_COLUMN' and rel.get('endId') == column_id:
             table_id = rel.get('startId')
-            table_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), table_id)
+            table_node = node_by_id.get(table_id)
             if table_node and table_node.get('primaryLabel') == 'Table':
                 return table_node
     return None
 
 
-def find_direct_dependent_code(node_id, impact_data):
+def find_direct_dependent_code(node_id, impact_data, node_by_id=None):
     """Find code that directly depends on the given database entity"""
+    if node_by_id is None:
+        node_by_id = {n['id']: n for n in impact_data.get('data', {}).get('nodes', [])}
     dependent_code = []
     for rel in impact_data.get('data', {}).get('relationships', []):
         # Check for code that references our target
-        if rel.get('endId') == node_id and rel.get('type') in ['REFERENCES', 'USES', 'SELECTS', 'UPDATES', 'INSERTS', 'DELETES', 'REFERENCES_TABLE']:
-            source_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel.get('startId'))
+        if rel.get('endId') == node_id and rel.get('type') in CODE_ACCESS_RELATIONSHIP_TYPES:
+            source_node = node_by_id.get(rel.get('startId'))
             if source_node and source_node.get('primaryLabel', '').endswith(('MethodEntity', 'ClassEntity')):
                 dependent_code.append({
                     "id": source_node.get('id'),
@@ -632,13 +711,15 @@ def find_direct_dependent_code(node_id, impact_data):
     return dependent_code
 
 
-def find_referencing_database_objects(node_id, impact_data):
+def find_referencing_database_objects(node_id, impact_data, node_by_id=None):
     """Find database objects that reference the given entity"""
+    if node_by_id is None:
+        node_by_id = {n['id']: n for n in impact_data.get('data', {}).get('nodes', [])}
     referencing_objects = []
     for rel in impact_data.get('data', {}).get('relationships', []):
-        if rel.get('endId') == node_id and rel.get('type') in ['REFERENCES', 'FOREIGN_KEY']:
-            source_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), rel.get('startId'))
-            if source_node and source_node.get('primaryLabel') in ['Table', 'Column', 'View']:
+        if rel.get('endId') == node_id and rel.get('type') in DATABASE_REFERENCE_RELATIONSHIP_TYPES:
+            source_node = node_by_id.get(rel.get('startId'))
+            if source_node and source_node.get('primaryLabel') in DATABASE_ENTITY_LABELS:
                 schema = extract_schema_name(source_node, impact_data.get('data', {}).get('nodes', [])) or 'Unknown'
                 referencing_objects.append({
                     "id": source_node.get('id'),
@@ -688,7 +769,7 @@ def extract_dependent_applications(dependent_code, impact_data):
     return applications
 
 
-def find_database_applications(node_id, impact_data):
+def find_database_applications(node_id, impact_data, node_by_id=None):
     """
     Find applications that directly or indirectly group the database entity.
 
@@ -699,10 +780,14 @@ def find_database_applications(node_id, impact_data):
     Args:
         node_id (str): ID of the database entity node
         impact_data (dict): Impact analysis data from the API
+        node_by_id (dict, optional): Prebuilt mapping of node ID to node; built
+            from ``impact_data`` when not supplied
 
     Returns:
         list: Names of applications that group this database entity
     """
+    if node_by_id is None:
+        node_by_id = {n['id']: n for n in impact_data.get('data', {}).get('nodes', [])}
     applications = []
     processed_nodes = set()  # Track processed nodes to avoid infinite recursion
 
@@ -731,7 +816,7 @@ def find_database_applications(node_id, impact_data):
             # These can lead us to components that might be grouped by applications
             if rel.get('endId') == current_id:
                 # Follow containment and reference relationships up the chain
-                if rel.get('type').startswith('CONTAINS_') or rel.get('type') in ['REFERENCES', 'REFERENCES_TABLE']:
+                if rel.get('type').startswith('CONTAINS_') or rel.get('type') in TABLE_REFERENCE_RELATIONSHIP_TYPES:
                     # Recursively check the parent node
                     traverse_relationships(rel.get('startId'))
 
@@ -740,29 +825,38 @@ def find_database_applications(node_id, impact_data):
 
     # Additional check for database-specific structures
     # Some applications might group the database or schema containing our entity
-    current_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), node_id)
-    if current_node and current_node.get('primaryLabel') in ['Table', 'Column', 'View']:
+    current_node = node_by_id.get(node_id)
+    if current_node and current_node.get('primaryLabel') in DATABASE_ENTITY_LABELS:
         # Try to find the database node
         for rel in impact_data.get('data', {}).get('relationships', []):
             if rel.get('type').startswith('CONTAINS_') and rel.get('endId') == node_id:
                 # This might be a schema containing our table or a table containing our column
                 container_id = rel.get('startId')
-                container_node = find_node_by_id(impact_data.get('data', {}).get('nodes', []), container_id)
+                container_node = node_by_id.get(container_id)
 
-                if container_node and container_node.get('primaryLabel') in ['Table', 'Schema', 'Database']:
+                if container_node and container_node.get('primaryLabel') in DATABASE_CONTAINER_LABELS:
                     # Recursively process this container to find applications
                     traverse_relationships(container_id)
 
     return applications
 
 
-def find_api_endpoints(nodes, relationships):
+@lru_cache(maxsize=256)
+def _is_controller_label(label):
+    """Return True if a primaryLabel names an API controller (cached, as the label vocabulary is small)"""
+    label_lower = label.lower()
+    return any(term in label_lower for term in CONTROLLER_LABEL_TERMS)
+
+
+def find_api_endpoints(nodes, relationships, node_by_id=None):
     """
     Find API endpoints, controllers, and their dependencies in impact data.
 
     Args:
         nodes (list): List of nodes from impact analysis
         relationships (list): List of relationships from impact analysis
+        node_by_id (dict, optional): Prebuilt mapping of node ID to node; built
+            from ``nodes`` when not supplied
 
     Returns:
         tuple: (endpoint_nodes, rest_endpoints, api_controllers, endpoint_dependencies)
@@ -771,11 +865,16 @@ def find_api_endpoints(nodes, relationships):
             - api_controllers: Controller classes
             - endpoint_dependencies: Dependencies between endpoints
     """
-    # Find explicit endpoints
+    # Classify explicit endpoints, controllers and REST-annotated methods in one pass
     endpoint_nodes = []
+    rest_endpoints = []
+    api_controllers = []
+
     for node_item in nodes:
+        label = node_item.get('primaryLabel', '')
+
         # Check for Endpoint primary label
-        if node_item.get('primaryLabel') == 'Endpoint':
+        if label == 'Endpoint':
             endpoint_nodes.append({
                 'name': node_item.get('name', ''),
                 'path': node_item.get('properties', {}).get('path', ''),
@@ -783,39 +882,35 @@ def find_api_endpoints(nodes, relationships):
                 'id': node_item.get('id')
             })
 
-    # Find REST-annotated methods
-    rest_endpoints = []
-    api_controllers = []
-
-    for node_item in nodes:
         # Check for controller types
-        if any(term in node_item.get('primaryLabel', '').lower() for term in
-               ['controller', 'restendpoint', 'apiendpoint', 'webservice']):
+        if _is_controller_label(label):
             api_controllers.append({
                 'name': node_item.get('name', ''),
-                'type': node_item.get('primaryLabel', '')
+                'type': label
             })
 
         # Check for REST annotations on methods
-        if node_item.get('primaryLabel') in ['JavaMethodEntity', 'DotNetMethodEntity']:
+        if label in METHOD_ENTITY_TYPES:
             annotations = node_item.get('properties', {}).get('annotations', [])
-            if annotations and any(
-                    anno.lower() in str(annotations).lower() for anno in
-                    [
-                        'getmapping', 'postmapping', 'putmapping', 'deletemapping',
-                        'requestmapping', 'httpget', 'httppost', 'httpput', 'httpdelete'
-                    ]):
+            if not annotations:
+                continue
+            # Lowercase the annotations once rather than once per marker
+            annotation_blob = str(annotations).lower()
+            if any(marker in annotation_blob for marker in REST_MARKERS):
                 rest_endpoints.append({
                     'name': node_item.get('name', ''),
-                    'annotation': str([a for a in annotations if any(m in a.lower() for m in ['mapping', 'http'])])
+                    'annotation': str([a for a in annotations if any(m in a.lower() for m in REST_MARKER_SUBSTR)])
                 })
 
     # Find endpoint dependencies
+    if node_by_id is None:
+        node_by_id = {node_item.get('id'): node_item for node_item in nodes}
+
     endpoint_dependencies = []
     for rel in relationships:
-        if rel.get('type') in ['INVOKES_ENDPOINT', 'REFERENCES_ENDPOINT']:
-            start_node = find_node_by_id(nodes, rel.get('startId'))
-            end_node = find_node_by_id(nodes, rel.get('endId'))
+        if rel.get('type') in ENDPOINT_RELATIONSHIP_TYPES:
+            start_node = node_by_id.get(rel.get('startId'))
+            end_node = node_by_id.get(rel.get('endId'))
 
             if start_node and end_node:
                 endpoint_dependencies.append({
@@ -831,26 +926,26 @@ def generate_combined_database_report(entity_type, search_name, table_or_view, s
     Generate a combined report for all database entities.
     """
     table_view_text = f" in {table_or_view}" if table_or_view else ""
-    report = f"# Database Impact Analysis: {entity_type.capitalize()}s matching '{search_name}'{table_view_text}\n\n"
-    report += f"## Overview\nFound {len(search_results)} {entity_type}(s) matching your search criteria.\n\n"
+    parts = [f"# Database Impact Analysis: {entity_type.capitalize()}s matching '{search_name}'{table_view_text}\n\n"]
+    parts.append(f"## Overview\nFound {len(search_results)} {entity_type}(s) matching your search criteria.\n\n")
     if not all_impacts:
-        report += "No impact analysis data could be retrieved for these entities.\n"
-        return report
+        parts.append("No impact analysis data could be retrieved for these entities.\n")
+        return "".join(parts)
 
     # Collect all applications across all impacts
     all_apps = set()
     for impact in all_impacts:
         all_apps.update(impact.get("dependent_applications", []))
 
-    report += "## Application Impact\n"
+    parts.append("## Application Impact\n")
     if all_apps:
-        report += f"Changes to these database objects could affect {len(all_apps)} applications:\n\n"
+        parts.append(f"Changes to these database objects could affect {len(all_apps)} applications:\n\n")
         for app in sorted(all_apps):
-            report += f"- `{app}`\n"
+            parts.append(f"- `{app}`\n")
     else:
-        report += "No applications appear to directly depend on these database objects.\n"
+        parts.append("No applications appear to directly depend on these database objects.\n")
 
-    report += "\n## Detailed Analysis\n\n"
+    parts.append("\n## Detailed Analysis\n\n")
     for i, impact in enumerate(all_impacts):
         entity_name = impact.get("name", "Unknown")
         entity_schema = impact.get("schema", "Unknown")
@@ -863,72 +958,72 @@ def generate_combined_database_report(entity_type, search_name, table_or_view, s
         else:
             entity_id = f"`{entity_schema}.{entity_name}`"
 
-        report += f"### {i + 1}. {entity_type.capitalize()}: {entity_id}\n\n"
+        parts.append(f"### {i + 1}. {entity_type.capitalize()}: {entity_id}\n\n")
 
         # Add code ownership information if available
         code_owners = impact.get("code_owners", [])
         code_reviewers = impact.get("code_reviewers", [])
 
         if code_owners or code_reviewers:
-            report += "#### Code Ownership\n"
+            parts.append("#### Code Ownership\n")
             if code_owners:
-                report += f"👤 **Code Owners**: {', '.join(code_owners)}\n"
+                parts.append(f"👤 **Code Owners**: {', '.join(code_owners)}\n")
             if code_reviewers:
-                report += f"👁️ **Preferred Reviewers**: {', '.join(code_reviewers)}\n"
+                parts.append(f"👁️ **Preferred Reviewers**: {', '.join(code_reviewers)}\n")
             if code_owners:
-                report += "\nConsult with the code owners before making significant changes to ensure alignment with original design intent.\n\n"
+                parts.append("\nConsult with the code owners before making significant changes to ensure alignment with original design intent.\n\n")
             else:
-                report += "\n"
+                parts.append("\n")
 
         # For columns, show the parent table information
         parent_table = impact.get("parent_table")
         if parent_table and entity_type == "column":
             parent_table_name = parent_table.get("name", "Unknown")
-            report += f"This column is part of the `{parent_table_name}` table.\n\n"
+            parts.append(f"This column is part of the `{parent_table_name}` table.\n\n")
 
         # Show code dependencies
         dependent_code = impact.get("dependent_code", [])
-        report += "#### Code Dependencies\n"
+        parts.append("#### Code Dependencies\n")
         if dependent_code:
-            report += f"This database object is referenced by {len(dependent_code)} code elements:\n\n"
-            report += "| Code Element | Type | Relationship | Reference Type | Complexity |\n|-------------|------|-------------|---------------|------------|\n"
+            parts.append(f"This database object is referenced by {len(dependent_code)} code elements:\n\n")
+            parts.append("| Code Element | Type | Relationship | Reference Type | Complexity |\n|-------------|------|-------------|---------------|------------|\n")
             for code in dependent_code[:10]:
                 reference_type = code.get("relationship_type", "direct")
                 complexity = code.get("complexity", "N/A")
-                report += f"| `{code['name']}` | {code['type']} | {code['relationship']} | {reference_type} | {complexity} |\n"
+                parts.append(f"| `{code['name']}` | {code['type']} | {code['relationship']} | {reference_type} | {complexity} |\n")
             if len(dependent_code) > 10:
-                report += f"\n*...and {len(dependent_code) - 10} more*\n"
+                parts.append(f"\n*...and {len(dependent_code) - 10} more*\n")
         else:
-            report += "No code elements directly reference this database object.\n"
+            parts.append("No code elements directly reference this database object.\n")
 
         # Show related database objects
         referencing_tables = impact.get("referencing_tables", [])
         if referencing_tables:
-            report += "\n#### Related Database Objects\n"
-            report += f"This database object is referenced by {len(referencing_tables)} other database objects:\n\n"
-            report += "| Database Object | Type | Schema |\n|----------------|------|--------|\n"
+            parts.append("\n#### Related Database Objects\n")
+            parts.append(f"This database object is referenced by {len(referencing_tables)} other database objects:\n\n")
+            parts.append("| Database Object | Type | Schema |\n|----------------|------|--------|\n")
             for table in referencing_tables[:10]:
-                report += f"| `{table['name']}` | {table['type']} | {table['schema']} |\n"
+                parts.append(f"| `{table['name']}` | {table['type']} | {table['schema']} |\n")
             if len(referencing_tables) > 10:
-                report += f"\n*...and {len(referencing_tables) - 10} more*\n"
+                parts.append(f"\n*...and {len(referencing_tables) - 10} more*\n")
 
         # Risk assessment
-        report += "\n#### Risk Assessment\n"
+        parts.append("\n#### Risk Assessment\n")
         total_deps = len(dependent_code) + len(referencing_tables)
         if total_deps > 20:
-            report += "⚠️ **High Risk**: This database object has numerous dependencies. Changes require careful planning and thorough testing.\n"
+            parts.append("⚠️ **High Risk**: This database object has numerous dependencies. Changes require careful planning and thorough testing.\n")
         elif total_deps > 5:
-            report += "⚠️ **Medium Risk**: This database object has multiple dependencies. Changes should be tested across affected systems.\n"
+            parts.append("⚠️ **Medium Risk**: This database object has multiple dependencies. Changes should be tested across affected systems.\n")
         else:
-            report += "✅ **Low Risk**: This database object has few dependencies. Changes are likely isolated.\n"
+            parts.append("✅ **Low Risk**: This database object has few dependencies. Changes are likely isolated.\n")
 
         # Cross-application impact warning
         if len(impact.get("dependent_applications", [])) > 1:
-            report += "\n⚠️ **Cross-Application Impact**: Changes to this database object affect multiple applications.\n"
-        report += "\n"
+            parts.append("\n⚠️ **Cross-Application Impact**: Changes to this database object affect multiple applications.\n")
+        parts.append("\n")
 
     # Add best practices section
-    report += """
+    parts.append("""
 ## Best Practices for Database Changes
 
 ### Guidelines for AI
@@ -944,5 +1039,5 @@ def generate_combined_database_report(entity_type, search_name, table_or_view, s
 3. Consider implementing feature flags for risky changes
 4. Plan for rollback procedures
 5. Test all affected applications after changes
-"""
-    return report
+""")
+    return "".join(parts)
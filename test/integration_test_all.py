@@ -179,7 +179,7 @@ class TestUtils(TestCase):
             impact = self.get_impact.__func__(node_id)
         except (httpx.ConnectError, OSError):
             self.skipTest("CodeLogic server not reachable")
-        self.assertIsInstance(impact, str)
+        self.assertIsInstance(impact, dict)
 
 
 if __name__ == '__main__':
@@ -26,9 +26,13 @@ from codelogic_mcp_server.handlers.ci import (
     generate_log_filter_script,
     generate_log_filtering_instructions,
     generate_docker_agent_config,
+    generate_file_modifications,
     generate_github_actions_config,
+    generate_gitlab_config,
+    generate_jenkins_config,
     handle_ci as _handle_ci_async,
 )
+from codelogic_mcp_server.handlers import handle_call_tool
 from codelogic_mcp_server.handlers.common import (
     SEND_BUILD_INFO_IMAGE,
     SEND_BUILD_INFO_GITHUB_ACTION,
@@ -42,6 +46,11 @@ def handle_ci(arguments):
     return asyncio.run(_handle_ci_async(arguments))
 
 
+def call_ci_tool(arguments):
+    """Run the codelogic-ci tool through handle_call_tool, which applies its inputSchema."""
+    return asyncio.run(handle_call_tool("codelogic-ci", arguments))
+
+
 class TestAnalyzeBuildLogs(TestCase):
     """Test the analyze_build_logs function"""
 
@@ -507,6 +516,15 @@ class TestSendBuildInfoImageLocation(TestCase):
         self.assertIn(SEND_BUILD_INFO_IMAGE, cfg)
         self.assertNotIn("codelogic_java:latest send_build_info", cfg)
 
+    def test_docker_agent_config_memoized_without_log_filtering(self):
+        args = ("java", "/tmp/app", "App", "jenkins", "https://example.com")
+        self.assertIs(generate_docker_agent_config(*args), generate_docker_agent_config(*args))
+
+        log_filtering_config = {"exclude_patterns": ["^DEBUG"]}
+        cfg = generate_docker_agent_config(*args, log_filtering_config)
+        self.assertIn("Log Filtering Enabled", cfg)
+        self.assertIsNot(cfg, generate_docker_agent_config(*args, log_filtering_config))
+
     def test_github_actions_config_uses_action(self):
         cfg = generate_github_actions_config(
             "dotnet", "/tmp", "App", "https://example.com"
@@ -530,5 +548,167 @@ class TestSendBuildInfoImageLocation(TestCase):
         self.assertNotIn("codelogic_java:latest send_build_info", text)
 
 
+class TestMultiAgentScan(TestCase):
+    """Test fanning a scan out across several agent types"""
+
+    def test_github_actions_matrix(self):
+        cfg = generate_github_actions_config(
+            "dotnet", "/tmp", "App", "https://example.com", ("dotnet", "java")
+        )
+        self.assertIn('agent-type: ["dotnet", "java"]', cfg)
+        self.assertIn("fail-fast: false", cfg)
+        self.assertIn("codelogic_${{ matrix.agent-type }}:latest analyze", cfg)
+
+    @patch.dict(os.environ, {'CODELOGIC_SERVER_HOST': 'https://test.codelogic.com'})
+    def test_jenkins_parallel_stages(self):
+        result = handle_ci({
+            "agent_type": "dotnet",
+            "additional_agent_types": ["java", "dotnet"],
+            "scan_path": "/path/to/scan",
+            "application_name": "TestApp",
+            "ci_platform": "jenkins",
+        })
+        text = result[0].text
+        self.assertIn("parallel {", text)
+        self.assertEqual(text.count("stage('CodeLogic Scan - dotnet')"), 1)
+        self.assertIn("stage('CodeLogic Scan - java')", text)
+        # Images are pulled once before the parallel branches run
+        self.assertIn("stage('Warm image cache')", text)
+        self.assertLess(text.index("stage('Warm image cache')"), text.index("parallel {"))
+
+    @patch.dict(os.environ, {'CODELOGIC_SERVER_HOST': 'https://test.codelogic.com'})
+    def test_jenkins_scans_reuse_cached_image(self):
+        result = handle_ci({
+            "agent_type": "dotnet",
+            "scan_path": "/path/to/scan",
+            "application_name": "TestApp",
+            "ci_platform": "jenkins",
+        })
+        self.assertNotIn("Use `--pull always`", result[0].text)
+        cfg = generate_jenkins_config("dotnet", "/tmp", "App", "https://example.com")
+        self.assertIn("docker run --rm --interactive", cfg)
+        self.assertNotIn("--pull always", cfg)
+
+    def test_github_file_modifications_match_guide(self):
+        modifications = generate_file_modifications(
+            "github-actions", "java", "/tmp", "App", "https://example.com", "codelogic_java",
+            None, ("java", "dotnet"), "large",
+        )
+        workflow = modifications["modifications"][0]["content"]
+        cfg = generate_github_actions_config(
+            "java", "/tmp", "App", "https://example.com", ("java", "dotnet"), runner_size="large"
+        )
+        self.assertIn(f"```yaml\n{workflow}\n```", cfg)
+        self.assertIn("actions/cache@v4", workflow)
+        self.assertNotIn("--pull always", workflow)
+
+    @patch.dict(os.environ, {'CODELOGIC_SERVER_HOST': 'https://test.codelogic.com'})
+    def test_runner_size_applies_to_scan_job_only(self):
+        result = handle_ci({
+            "agent_type": "java",
+            "scan_path": "/path/to/scan",
+            "application_name": "TestApp",
+            "ci_platform": "github-actions",
+            "runner_size": "large",
+        })
+        text = result[0].text
+        self.assertIn("runs-on: ubuntu-latest-4-cores", text)
+        send_job = text[text.index("  send-build-info:"):]
+        self.assertTrue(send_job.startswith("  send-build-info:\n    runs-on: ubuntu-latest\n"))
+        # The larger runner's cores are not capped by a container CPU limit
+        self.assertNotIn("--cpus=", text)
+        self.assertNotIn("--memory=", text)
+
+        with self.assertRaises(ValueError):
+            call_ci_tool({
+                "agent_type": "java",
+                "scan_path": "/path/to/scan",
+                "application_name": "TestApp",
+                "ci_platform": "github-actions",
+                "runner_size": "huge",
+            })
+
+    def test_github_file_modifications_cancel_superseded_pr_runs(self):
+        modifications = generate_file_modifications(
+            "github-actions", "java", "/tmp", "App", "https://example.com", "codelogic_java"
+        )
+        workflow = modifications["modifications"][0]["content"]
+        self.assertIn("group: codelogic-${{ github.workflow }}-${{ github.ref }}", workflow)
+        self.assertIn("cancel-in-progress: ${{ github.event_name == 'pull_request' }}", workflow)
+
+    def test_github_file_modifications_ignore_docs_only_changes(self):
+        modifications = generate_file_modifications(
+            "github-actions", "java", "/tmp", "App", "https://example.com", "codelogic_java"
+        )
+        workflow = modifications["modifications"][0]["content"]
+        paths_ignore = "paths-ignore: [ '**.md', 'docs/**', '.github/ISSUE_TEMPLATE/**', 'LICENSE' ]"
+        # Both the push and pull_request triggers skip docs-only changes
+        self.assertEqual(workflow.count(paths_ignore), 2)
+
+    def test_unpinned_cached_images_refresh(self):
+        cfg = generate_github_actions_config("java", "/tmp", "App", "https://example.com")
+        self.assertIn("steps.codelogic-image-week.outputs.week", cfg)
+        pinned = generate_github_actions_config("java", "/tmp", "App", "https://example.com", image_digest="ab" * 32)
+        self.assertNotIn("codelogic-image-week", pinned)
+        self.assertIn("key: codelogic-java-abababababab", pinned)
+
+        self.assertIn('docker pull --quiet "$CODELOGIC_IMAGE" || true', generate_gitlab_config("java", "/tmp", "App", "https://example.com"))
+        self.assertNotIn("--quiet", generate_gitlab_config("java", "/tmp", "App", "https://example.com", image_digest="ab" * 32))
+
+    @patch.dict(os.environ, {'CODELOGIC_SERVER_HOST': 'https://test.codelogic.com'})
+    def test_image_digest_pins_agent_image(self):
+        digest = "ab" * 32
+        for ci_platform in ("jenkins", "github-actions", "azure-devops", "gitlab", "generic"):
+            for build_log in (None, "Downloading a\nDownloading b\nDownloading c\n"):
+                with self.subTest(ci_platform=ci_platform, with_log_filtering=bool(build_log)):
+                    result = handle_ci({
+                        "agent_type": "java",
+                        "scan_path": "/path/to/scan",
+                        "application_name": "TestApp",
+                        "ci_platform": ci_platform,
+                        "image_digest": f"sha256:{digest}",
+                        "successful_build_log": build_log,
+                    })
+                    text = result[0].text
+                    self.assertIn(f"codelogic_java@sha256:{digest}", text)
+                    self.assertNotIn("codelogic_java:latest", text)
+                    self.assertNotIn("matrix.agent-type }}:latest", text)
+                    # Single-line and multi-line (--pull always \\) forms alike
+                    self.assertNotIn("--pull always", text)
+
+    def test_invalid_image_digest(self):
+        with self.assertRaises(ValueError):
+            handle_ci({
+                "agent_type": "java",
+                "scan_path": "/path/to/scan",
+                "application_name": "TestApp",
+                "image_digest": "latest",
+            })
+
+    def test_invalid_additional_agent_type(self):
+        with self.assertRaises(ValueError):
+            call_ci_tool({
+                "agent_type": "dotnet",
+                "additional_agent_types": ["cobol"],
+                "scan_path": "/path/to/scan",
+                "application_name": "TestApp",
+            })
+
+    def test_direct_call_validates_arguments(self):
+        valid = {"agent_type": "java", "scan_path": "/path/to/scan", "application_name": "TestApp"}
+        for arguments in (
+            None,
+            {},
+            {"agent_type": "java", "scan_path": "/path/to/scan"},
+            {**valid, "agent_type": "cobol"},
+            {**valid, "ci_platform": "travis"},
+            {**valid, "runner_size": "huge"},
+            {**valid, "additional_agent_types": ["cobol"]},
+        ):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(ValueError):
+                    handle_ci(arguments)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,54 @@
+# Copyright (C) 2025 CodeLogic Inc.
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the codelogic-database-impact handler."""
+
+import asyncio
+import unittest
+
+import test.test_env  # noqa: F401 — apply DEFAULT_TEST_ENV before package imports
+from unittest.mock import AsyncMock, patch
+
+from codelogic_mcp_server.handlers.database_impact import handle_database_impact
+
+
+EMPTY_IMPACT = {"data": {"nodes": [], "relationships": []}}
+
+
+class TestDatabaseImpact(unittest.TestCase):
+    def test_invalid_entity_type(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(handle_database_impact({"entity_type": "index", "name": "ix_orders"}))
+
+    @patch("codelogic_mcp_server.handlers.database_impact.get_impact")
+    @patch("codelogic_mcp_server.handlers.database_impact.search_database_entity", new_callable=AsyncMock)
+    def test_duplicate_search_results_analyzed_once(self, mock_search, mock_get_impact):
+        mock_search.return_value = [
+            {"id": "1", "name": "orders", "schema": "dbo"},
+            {"id": "1", "name": "orders", "schema": "dbo"},
+            {"id": "2", "name": "orders", "schema": "sales"},
+        ]
+        mock_get_impact.return_value = EMPTY_IMPACT
+
+        result = asyncio.run(handle_database_impact({"entity_type": "table", "name": "orders"}))
+
+        self.assertEqual(sorted(call.args[0] for call in mock_get_impact.call_args_list), ["1", "2"])
+        self.assertIn("`dbo.orders`", result[0].text)
+        self.assertIn("`sales.orders`", result[0].text)
+        self.assertIn("Found 2 table(s)", result[0].text)
+
+    @patch("codelogic_mcp_server.handlers.database_impact.get_impact")
+    @patch("codelogic_mcp_server.handlers.database_impact.search_database_entity", new_callable=AsyncMock)
+    def test_analyzes_at_most_five_entities(self, mock_search, mock_get_impact):
+        mock_search.return_value = [{"id": str(i), "name": f"t{i}", "schema": "dbo"} for i in range(8)]
+        mock_get_impact.return_value = EMPTY_IMPACT
+
+        asyncio.run(handle_database_impact({"entity_type": "table", "name": "t"}))
+
+        self.assertEqual(mock_get_impact.call_count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import unittest
 import mcp.types as types
 from unittest.mock import AsyncMock, patch
 from codelogic_mcp_server.handlers import handle_call_tool
+from codelogic_mcp_server.handlers.method_impact import MAX_BATCH_ITEMS
 from codelogic_mcp_server.utils import extract_relationships
 
 
@@ -120,5 +122,36 @@ class TestExtractRelationships(unittest.TestCase):
         self.assertEqual(result, expected_output)
 
 
+class TestInputValidation(unittest.TestCase):
+    def test_missing_required_argument_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Input validation error: 'class' is a required property"):
+            asyncio.run(handle_call_tool('codelogic-method-impact', {'method': 'method_name'}))
+
+    def test_invalid_enum_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Input validation error"):
+            asyncio.run(handle_call_tool('codelogic-ci', {'agent_type': 'cobol', 'scan_path': '.', 'application_name': 'app'}))
+
+    def test_oversized_batch_is_rejected(self):
+        items = [{'method': f'method{i}', 'class': 'OrderService'} for i in range(MAX_BATCH_ITEMS + 1)]
+        with self.assertRaisesRegex(ValueError, "Input validation error"):
+            asyncio.run(handle_call_tool('codelogic-method-impact-batch', {'items': items}))
+
+    def test_valid_arguments_are_dispatched(self):
+        mock_ci = AsyncMock(return_value=[types.TextContent(type="text", text="ok")])
+        arguments = {'agent_type': 'java', 'scan_path': '.', 'application_name': 'app'}
+        with patch.dict('codelogic_mcp_server.handlers._DISPATCH', {'codelogic-ci': mock_ci}):
+            result = asyncio.run(handle_call_tool('codelogic-ci', arguments))
+        mock_ci.assert_awaited_once_with(arguments)
+        self.assertEqual(result[0].text, "ok")
+
+    def test_handler_error_is_reported_as_markdown(self):
+        mock_ci = AsyncMock(side_effect=RuntimeError("scan failed"))
+        arguments = {'agent_type': 'java', 'scan_path': '.', 'application_name': 'app'}
+        with patch.dict('codelogic_mcp_server.handlers._DISPATCH', {'codelogic-ci': mock_ci}):
+            result = asyncio.run(handle_call_tool('codelogic-ci', arguments))
+        self.assertTrue(result[0].text.startswith("# Error executing tool: codelogic-ci\n"))
+        self.assertIn("```\nscan failed\n```", result[0].text)
+
+
 if __name__ == '__main__':
     unittest.main()
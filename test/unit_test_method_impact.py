@@ -0,0 +1,183 @@
+# Copyright (C) 2025 CodeLogic Inc.
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the codelogic-method-impact handlers."""
+
+import asyncio
+import unittest
+
+import test.test_env  # noqa: F401 — apply DEFAULT_TEST_ENV before package imports
+from unittest.mock import patch
+
+import mcp.types as types
+
+from codelogic_mcp_server.handlers.method_impact import handle_method_impact, handle_method_impact_batch
+
+
+def _report(arguments):
+    return [types.TextContent(type="text", text=f"# Report {arguments['class']}.{arguments['method']}\n")]
+
+
+class TestMethodImpactBatch(unittest.TestCase):
+    def test_missing_items(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(handle_method_impact_batch({}))
+        with self.assertRaises(ValueError):
+            asyncio.run(handle_method_impact_batch({"items": []}))
+
+    @patch("codelogic_mcp_server.handlers.method_impact.handle_method_impact")
+    def test_reports_joined_in_order(self, mock_impact):
+        async def fake(arguments):
+            return _report(arguments)
+        mock_impact.side_effect = fake
+
+        result = asyncio.run(handle_method_impact_batch({"items": [
+            {"method": "save", "class": "OrderService"},
+            {"method": "load", "class": "OrderRepository"},
+        ]}))
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(
+            result[0].text,
+            "# Report OrderService.save\n\n---\n\n# Report OrderRepository.load\n",
+        )
+
+    @patch("codelogic_mcp_server.handlers.method_impact.handle_method_impact")
+    def test_failed_item_does_not_abort_batch(self, mock_impact):
+        async def fake(arguments):
+            if arguments["method"] == "missing":
+                raise ValueError("No matching class found for Nowhere")
+            return _report(arguments)
+        mock_impact.side_effect = fake
+
+        result = asyncio.run(handle_method_impact_batch({"items": [
+            {"method": "missing", "class": "Nowhere"},
+            {"method": "save", "class": "OrderService"},
+        ]}))
+
+        self.assertIn("Unable to Analyze Method: `missing`", result[0].text)
+        self.assertIn("No matching class found for Nowhere", result[0].text)
+        self.assertIn("# Report OrderService.save", result[0].text)
+
+    @patch("codelogic_mcp_server.handlers.method_impact.handle_method_impact")
+    def test_cancelled_item_does_not_abort_batch(self, mock_impact):
+        async def fake(arguments):
+            if arguments["method"] == "slow":
+                raise asyncio.CancelledError()
+            return _report(arguments)
+        mock_impact.side_effect = fake
+
+        result = asyncio.run(handle_method_impact_batch({"items": [
+            {"method": "slow", "class": "Reports"},
+            {"method": "save", "class": "OrderService"},
+        ]}))
+
+        self.assertIn("Unable to Analyze Method: `slow`", result[0].text)
+        self.assertIn("# Report OrderService.save", result[0].text)
+
+    @patch("codelogic_mcp_server.handlers.method_impact.handle_method_impact")
+    def test_duplicate_pairs_analyzed_once(self, mock_impact):
+        async def fake(arguments):
+            return _report(arguments)
+        mock_impact.side_effect = fake
+
+        result = asyncio.run(handle_method_impact_batch({"items": [
+            {"method": "save", "class": "OrderService"},
+            {"method": "load", "class": "OrderRepository"},
+            {"method": "save", "class": "OrderService"},
+            {"method": "save", "class": "OrderRepository"},
+        ]}))
+
+        self.assertEqual(mock_impact.call_count, 3)
+        self.assertEqual(
+            result[0].text,
+            "# Report OrderService.save\n\n---\n\n# Report OrderRepository.load\n"
+            "\n---\n\n# Report OrderRepository.save\n",
+        )
+
+    @patch("codelogic_mcp_server.handlers.method_impact.MAX_BATCH_ITEMS", 2)
+    @patch("codelogic_mcp_server.handlers.method_impact.handle_method_impact")
+    def test_too_many_items(self, mock_impact):
+        with self.assertRaises(ValueError):
+            asyncio.run(handle_method_impact_batch({"items": [
+                {"method": f"method{i}", "class": "OrderService"} for i in range(3)
+            ]}))
+        mock_impact.assert_not_called()
+
+
+class TestMethodLookupErrors(unittest.TestCase):
+    def _run(self, lookup_error):
+        module = "codelogic_mcp_server.handlers.method_impact"
+        with patch(f"{module}.get_workspace_name", return_value="ws"), \
+                patch(f"{module}.get_mv_id", return_value="mv"), \
+                patch(f"{module}.get_method_nodes", return_value=([], lookup_error)):
+            return asyncio.run(handle_method_impact({"method": "save"}))[0].text
+
+    def test_gateway_timeout_report(self):
+        text = self._run("gateway_timeout")
+
+        self.assertTrue(text.startswith("# Unable to Analyze Method: `save`"))
+        self.assertIn("504 Gateway Timeout", text)
+
+    def test_unknown_error_uses_generic_report(self):
+        text = self._run("http_error")
+
+        self.assertIn("failed (timeout, HTTP error, or empty result)", text)
+
+
+def _impact_graph(complexities):
+    nodes = [
+        {
+            "id": f"n{i}",
+            "identity": f"pkg|OrderService|save{i}",
+            "name": f"save{i}",
+            "primaryLabel": "JavaMethodEntity",
+            "properties": {"statistics.cyclomaticComplexity": complexity},
+        }
+        for i, complexity in enumerate(complexities)
+    ]
+    relationships = [
+        {"startId": f"n{i}", "endId": "n0", "type": "CALLS"}
+        for i in range(1, len(complexities))
+    ]
+    return {"data": {"nodes": nodes, "relationships": relationships}}
+
+
+class TestMethodImpactTableCaps(unittest.TestCase):
+    def _run(self, graph):
+        method_nodes = [{"identity": "pkg|OrderService|save0", "name": "save0", "properties": {"id": "n0"}}]
+        module = "codelogic_mcp_server.handlers.method_impact"
+        with patch(f"{module}.get_workspace_name", return_value="ws"), \
+                patch(f"{module}.get_mv_id", return_value="mv"), \
+                patch(f"{module}.get_method_nodes", return_value=(method_nodes, None)), \
+                patch(f"{module}.get_impact", return_value=graph):
+            return asyncio.run(handle_method_impact({"method": "save0", "class": "OrderService"}))[0].text
+
+    @patch("codelogic_mcp_server.handlers.method_impact.MAX_NODE_ROWS", 2)
+    def test_node_table_keeps_most_complex_nodes(self):
+        text = self._run(_impact_graph([1, 20, 5]))
+        metrics = text.split("## Detailed Node Metrics")[1].split("## Relationship Map")[0]
+
+        self.assertIn("| save1 |", metrics)
+        self.assertIn("| save2 |", metrics)
+        self.assertNotIn("| save0 |", metrics)
+        self.assertIn("... (1 more nodes omitted)", metrics)
+
+    @patch("codelogic_mcp_server.handlers.method_impact.MAX_RELATIONSHIP_ROWS", 1)
+    def test_relationship_table_is_capped(self):
+        text = self._run(_impact_graph([1, 2, 3]))
+        relationship_map = text.split("## Relationship Map")[1]
+
+        self.assertEqual(relationship_map.count("| CALLS |"), 1)
+        self.assertIn("... (1 more relationships omitted)", relationship_map)
+
+    def test_small_graph_is_not_capped(self):
+        text = self._run(_impact_graph([1, 20, 5]))
+
+        self.assertNotIn("omitted", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
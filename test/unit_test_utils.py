@@ -2,6 +2,7 @@ import unittest
 from unittest import mock
 from unittest.mock import Mock
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from io import StringIO
 from codelogic_mcp_server.utils import strip_unused_properties, find_api_endpoints
@@ -40,7 +41,7 @@ class TestUtils(TestCase):
             }
         })
 
-        expected_output = json.dumps({
+        expected_output = {
             "data": {
                 "nodes": [
                     {
@@ -51,7 +52,7 @@ class TestUtils(TestCase):
                     }
                 ]
             }
-        })
+        }
 
         result = strip_unused_properties(response_mock)
         self.assertEqual(result, expected_output)
@@ -64,11 +65,11 @@ class TestUtils(TestCase):
             }
         })
 
-        expected_output = json.dumps({
+        expected_output = {
             "data": {
                 "nodes": []
             }
-        })
+        }
 
         result = strip_unused_properties(response_mock)
         self.assertEqual(result, expected_output)
@@ -77,7 +78,7 @@ class TestUtils(TestCase):
         response_mock = Mock()
         response_mock.text = json.dumps({})
 
-        expected_output = json.dumps({})
+        expected_output = {}
 
         result = strip_unused_properties(response_mock)
         self.assertEqual(result, expected_output)
@@ -319,7 +320,7 @@ class TestImpactCaching(TestCase):
     def setUp(self):
         super().setUp()  # Set up clean test environment
         # Reset cached values before each test
-        utils._impact_cache = {}
+        utils._impact_cache.clear()
 
         # Mock stderr to capture logging
         self.stderr_patcher = mock.patch('sys.stderr', new_callable=StringIO)
@@ -372,11 +373,10 @@ class TestImpactCaching(TestCase):
         cached_impact, expiry = utils._impact_cache['node-123']
 
         # Verify the impact data is properly stripped
-        impact_data = json.loads(impact)
-        self.assertNotIn('agentIds', impact_data['data']['nodes'][0]['properties'])
-        self.assertNotIn('sourceScanContextIds', impact_data['data']['nodes'][0]['properties'])
-        self.assertNotIn('isScanRoot', impact_data['data']['nodes'][0]['properties'])
-        self.assertIn('keep', impact_data['data']['nodes'][0]['properties'])
+        self.assertNotIn('agentIds', impact['data']['nodes'][0]['properties'])
+        self.assertNotIn('sourceScanContextIds', impact['data']['nodes'][0]['properties'])
+        self.assertNotIn('isScanRoot', impact['data']['nodes'][0]['properties'])
+        self.assertIn('keep', impact['data']['nodes'][0]['properties'])
 
         # Verify expiry time
         self.assertEqual(expiry, now + timedelta(seconds=utils.IMPACT_CACHE_TTL))
@@ -395,7 +395,7 @@ class TestImpactCaching(TestCase):
         future = now + timedelta(seconds=60)  # 1 minute later
 
         # Set up initial cache with data valid for 5 minutes
-        cached_data = '{"data": {"nodes": [{"name": "cached_impact"}]}}'
+        cached_data = {"data": {"nodes": [{"name": "cached_impact"}]}}
         utils._impact_cache['node-123'] = (cached_data, now + timedelta(seconds=300))
 
         # Set current time to 1 minute after now (cache still valid)
@@ -421,7 +421,7 @@ class TestImpactCaching(TestCase):
         now = datetime(2023, 1, 1, 12, 0, 0)
 
         # Set up expired cache
-        cached_data = '{"data": {"nodes": [{"name": "expired_impact"}]}}'
+        cached_data = {"data": {"nodes": [{"name": "expired_impact"}]}}
         utils._impact_cache['node-123'] = (cached_data, now - timedelta(seconds=60))
 
         # Set current time
@@ -446,12 +446,107 @@ class TestImpactCaching(TestCase):
         impact = utils.get_impact('node-123')
 
         # Verify new data is fetched, cached and returned
-        impact_data = json.loads(impact)
-        self.assertEqual(impact_data['data']['nodes'][0]['name'], 'new_impact')
+        self.assertEqual(impact['data']['nodes'][0]['name'], 'new_impact')
 
         # Verify cache expired message
         self.assertIn("Impact cache expired for node-123", self.mock_stderr.getvalue())
 
+    @mock.patch('codelogic_mcp_server.utils.IMPACT_CACHE_MAX_ENTRIES', 2)
+    @mock.patch('codelogic_mcp_server.utils.authenticate')
+    @mock.patch('codelogic_mcp_server.utils._client.get')
+    @mock.patch('codelogic_mcp_server.utils.datetime')
+    def test_get_impact_evicts_least_recently_used(self, mock_datetime, mock_get, mock_authenticate):
+        """Test that get_impact() keeps at most IMPACT_CACHE_MAX_ENTRIES entries."""
+        now = datetime(2023, 1, 1, 12, 0, 0)
+        mock_datetime.now.return_value = now
+        mock_authenticate.return_value = 'test_token'
+
+        mock_response = mock.MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.text = json.dumps({'data': {'nodes': []}})
+        mock_get.return_value = mock_response
+
+        utils.get_impact('node-1')
+        utils.get_impact('node-2')
+        # Touch node-1 so node-2 becomes the least recently used entry
+        utils.get_impact('node-1')
+        utils.get_impact('node-3')
+
+        self.assertEqual(list(utils._impact_cache), ['node-1', 'node-3'])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch('codelogic_mcp_server.utils.IMPACT_CACHE_MAX_ENTRIES', 4)
+    @mock.patch('codelogic_mcp_server.utils.authenticate')
+    @mock.patch('codelogic_mcp_server.utils._client.get')
+    def test_get_impact_cache_is_thread_safe(self, mock_get, mock_authenticate):
+        """Test that concurrent get_impact() calls keep the cache bounded."""
+        mock_authenticate.return_value = 'test_token'
+
+        mock_response = mock.MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.text = json.dumps({'data': {'nodes': []}})
+        mock_get.return_value = mock_response
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(utils.get_impact, [f'node-{i % 10}' for i in range(200)]))
+
+        self.assertEqual(len(results), 200)
+        self.assertLessEqual(len(utils._impact_cache), 4)
+
+
+class TestMvIdCaching(TestCase):
+    """Test caching of materialized view ids."""
+
+    def setUp(self):
+        super().setUp()  # Set up clean test environment
+        # Reset cached values before each test
+        utils._mv_id_cache = {}
+
+        # Mock stderr to capture logging
+        self.stderr_patcher = mock.patch('sys.stderr', new_callable=StringIO)
+        self.mock_stderr = self.stderr_patcher.start()
+
+    def tearDown(self):
+        self.stderr_patcher.stop()
+        super().tearDown()  # Call parent tearDown to restore environment
+
+    @mock.patch('codelogic_mcp_server.utils.get_mv_id_from_def')
+    @mock.patch('codelogic_mcp_server.utils.get_mv_definition_id')
+    @mock.patch('codelogic_mcp_server.utils.authenticate')
+    @mock.patch('codelogic_mcp_server.utils.datetime')
+    def test_get_mv_id_caches_results(self, mock_datetime, mock_authenticate, mock_get_def_id, mock_get_from_def):
+        """Test that get_mv_id() only resolves the workspace once while cached."""
+        now = datetime(2023, 1, 1, 12, 0, 0)
+        mock_datetime.now.return_value = now
+        mock_authenticate.return_value = 'test_token'
+        mock_get_def_id.return_value = 'def-1'
+        mock_get_from_def.return_value = 'mv-1'
+
+        self.assertEqual(utils.get_mv_id('workspace'), 'mv-1')
+        self.assertEqual(utils.get_mv_id('workspace'), 'mv-1')
+
+        mock_get_def_id.assert_called_once_with('workspace', 'test_token')
+        mock_get_from_def.assert_called_once_with('def-1', 'test_token')
+        _, expiry = utils._mv_id_cache['workspace']
+        self.assertEqual(expiry, now + timedelta(seconds=utils.MV_ID_CACHE_TTL))
+        self.assertIn("Materialized view id cache hit for workspace", self.mock_stderr.getvalue())
+
+    @mock.patch('codelogic_mcp_server.utils.CACHE_DISABLED', True)
+    @mock.patch('codelogic_mcp_server.utils.get_mv_id_from_def')
+    @mock.patch('codelogic_mcp_server.utils.get_mv_definition_id')
+    @mock.patch('codelogic_mcp_server.utils.authenticate')
+    def test_get_mv_id_skips_cache_when_disabled(self, mock_authenticate, mock_get_def_id, mock_get_from_def):
+        """Test that CODELOGIC_CACHE_DISABLED bypasses the cache."""
+        mock_authenticate.return_value = 'test_token'
+        mock_get_def_id.return_value = 'def-1'
+        mock_get_from_def.return_value = 'mv-1'
+
+        utils.get_mv_id('workspace')
+        utils.get_mv_id('workspace')
+
+        self.assertEqual(mock_get_from_def.call_count, 2)
+        self.assertEqual(utils._mv_id_cache, {})
+
 
 class TestFindApiEndpoints(unittest.TestCase):
     """Test the find_api_endpoints utility function"""